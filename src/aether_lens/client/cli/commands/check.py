@@ -1,9 +1,8 @@
-import asyncio
-
 import click
 from dependency_injector.wiring import Provide, inject
 from rich.console import Console
 
+from aether_lens.core import eventloop
 from aether_lens.core.containers import Container
 
 console = Console(stderr=True)
@@ -20,7 +19,7 @@ def check(
 ):
     """Validate environment prerequisites and configuration integrity."""
     check_service.verbose = verbose
-    asyncio.run(check_service.check_prerequisites(target_dir))
+    eventloop.run(check_service.check_prerequisites(target_dir))
 
 
 @inject
@@ -1,10 +1,10 @@
-import asyncio
 import sys
 import time
 
 import click
 from dependency_injector.wiring import Provide, inject
 
+from aether_lens.core import eventloop
 from aether_lens.core.containers import Container
 from aether_lens.core.domain.events import EventEmitter, JSONLinesTransport
 from aether_lens.core.domain.models import PipelineLogEvent
@@ -74,4 +74,4 @@ def executor(
             )
             sys.exit(1)
 
-    asyncio.run(run())
+    eventloop.run(run())
@@ -2,6 +2,7 @@ import click
 from dependency_injector.wiring import Provide, inject
 from rich.console import Console
 
+from aether_lens.core import eventloop
 from aether_lens.core.containers import Container
 
 console = Console(stderr=True)
@@ -27,6 +28,7 @@ def loop(
     remote_path,
     browser_strategy,
     browser_url,
+    orchestrator: Container.orchestrator = Provide[Container.orchestrator],
     execution_service: Container.execution_service = Provide[
         Container.execution_service
     ],
@@ -37,11 +39,11 @@ def loop(
         console.print("[red]Error: Pod name is required for loop command.[/red]")
         return
 
-    # Use controller to start the loop
+    # The orchestrator owns the sync watcher; the controller stops services
     import asyncio
 
-    asyncio.run(
-        execution_service.start_loop(
+    async def _run():
+        observer = await orchestrator.start_loop(
             target_dir=target_dir,
             pod_name=pod_name,
             namespace=namespace,
@@ -49,14 +51,14 @@ def loop(
             browser_strategy=browser_strategy,
             browser_url=browser_url,
         )
-    )
-
-    # Since start_loop with blocking=False returns, but CLI usually wants to block
-    # We might need to keep it running here if we want the CLI to stay active.
-    import time
+        # start_loop returns immediately; keep its event loop alive for the
+        # watcher's sync consumer and sleep on the observer until interrupted
+        try:
+            await asyncio.to_thread(observer.join)
+        finally:
+            observer.stop()
 
     try:
-        while True:
-            time.sleep(1)
+        eventloop.run(_run())
     except KeyboardInterrupt:
-        execution_service.stop_dev_loop(target_dir)
+        eventloop.run(execution_service.stop_dev_loop(target_dir))
@@ -1,8 +1,7 @@
-import asyncio
-
 import click
 from dependency_injector.wiring import Provide, inject
 
+from aether_lens.core import eventloop
 from aether_lens.core.containers import Container
 
 
@@ -77,7 +76,7 @@ def run(
     """Run Aether Lens pipeline once."""
     # container access removed, using injected service
 
-    asyncio.run(
+    eventloop.run(
         service.run_pipeline(
             target_dir=target,
             interactive=False,
@@ -2,6 +2,7 @@ import click
 from dependency_injector.wiring import Provide, inject
 from rich.console import Console
 
+from aether_lens.core import eventloop
 from aether_lens.core.containers import Container
 
 console = Console(stderr=True)
@@ -18,7 +19,7 @@ def stop(
 ):
     """Stop an active Aether Lens loop."""
 
-    if execution_service.stop_dev_loop(target_dir):
+    if eventloop.run(execution_service.stop_dev_loop(target_dir)):
         click.echo(f"Lens loop stopped for {target_dir}")
     else:
         click.echo(f"No active loop found for {target_dir}")
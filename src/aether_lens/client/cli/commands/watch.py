@@ -6,6 +6,7 @@ import click
 from dependency_injector.wiring import Provide, inject
 from rich.console import Console
 
+from aether_lens.core import eventloop
 from aether_lens.core.containers import Container
 from aether_lens.core.domain.events import CallbackTransport, EventEmitter
 from aether_lens.core.presentation.tui import PipelineDashboard
@@ -82,7 +83,7 @@ def watch(
                 while True:
                     await asyncio.sleep(1)
             except asyncio.CancelledError:
-                execution_service.stop_dev_loop(target_dir)
+                await execution_service.stop_dev_loop(target_dir)
         else:
             app = PipelineDashboard([], strategy_name=strategy)
             emitter = EventEmitter(
@@ -108,20 +109,19 @@ def watch(
 
                 from aether_lens.daemon.controller.watcher import start_watcher
 
-                async def _on_watch_change(path):
+                async def _on_watch_change(paths):
                     await execution_service.run_pipeline(
                         target_dir=target_dir,
                         strategy=strategy,
                         interactive=True,
                         event_emitter=emitter,
                         app_url=app_url,
+                        instrument=False,
+                        changed_paths=paths,
                     )
 
-                def on_change(path):
-                    loop.create_task(_on_watch_change(path))
-
                 observer = start_watcher(
-                    target_dir, on_change, blocking=False, loop=loop
+                    target_dir, _on_watch_change, blocking=False, loop=loop
                 )
                 if execution_service.lifecycle_registry:
                     execution_service.lifecycle_registry.register(target_dir, observer)
@@ -130,6 +130,6 @@ def watch(
             await app.run_async()
 
     try:
-        asyncio.run(run_watch())
+        eventloop.run(run_watch())
     except KeyboardInterrupt:
-        execution_service.stop_dev_loop(target_dir)
+        eventloop.run(execution_service.stop_dev_loop(target_dir))
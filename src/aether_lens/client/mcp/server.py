@@ -86,7 +86,7 @@ async def _run_pipeline_impl(
     browser_url: str,
     execution_service=Provide[Container.execution_service],
 ):
-    target_dir = str(Path(target_dir).resolve())
+    target_dir = execution_service.resolve_target_dir(target_dir)
     return await execution_service.run_pipeline(
         target_dir=target_dir,
         browser_url=browser_url,
@@ -154,13 +154,13 @@ async def start_lens_loop(
 
 @mcp.tool()
 @inject
-def stop_lens_loop(
+async def stop_lens_loop(
     target_dir: str, execution_service=Provide[Container.execution_service]
 ):
     """
     Stop the active Lens Loop daemon for a directory.
     """
-    if execution_service.stop_dev_loop(target_dir):
+    if await execution_service.stop_dev_loop(target_dir):
         return f"Lens Loop stopped for {target_dir}."
     else:
         return f"No active Lens Loop found for {target_dir}."
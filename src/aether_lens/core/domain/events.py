@@ -1,4 +1,5 @@
 import asyncio
+import json
 from abc import ABC, abstractmethod
 from typing import Any, Callable, List, Optional
 
@@ -18,8 +19,6 @@ class JSONLinesTransport(EventTransport):
         if hasattr(event, "to_json"):
             line = event.to_json()
         else:
-            import json
-
             line = json.dumps(event)
         print(line, flush=True)
 
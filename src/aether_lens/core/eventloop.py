@@ -0,0 +1,22 @@
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, backed by uvloop when it is installed."""
+    return uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+
+def run(coro):
+    """``asyncio.run()`` on uvloop when it is installed.
+
+    The loop is created per call, so the global event loop policy is never
+    touched.
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
@@ -19,11 +19,11 @@ class PipelineFormatter:
 
         if output:
             try:
-                if isinstance(output, str):
-                    rich_text = Text.from_ansi(output)
-                    formatted_output = (
-                        rich_text.markup if "\x1b[" in output else escape(output)
-                    )
+                # Only run the ANSI parser when there are escape codes to parse
+                if isinstance(output, str) and "\x1b[" in output:
+                    formatted_output = Text.from_ansi(output).markup
+                elif isinstance(output, str):
+                    formatted_output = escape(output)
                 else:
                     formatted_output = escape(str(output))
 
@@ -75,6 +75,11 @@ class PipelineFormatter:
         """Format deployment hook start message."""
         return f" -> [Execution] Running deployment hook: [cyan]{command}[/cyan]"
 
+    @staticmethod
+    def format_deployment_hook_output(line: str) -> str:
+        """Format a single streamed line of deployment hook output."""
+        return f"      [dim]{escape(line)}[/dim]"
+
     @staticmethod
     def format_deployment_hook_success() -> str:
         """Format deployment hook success message."""
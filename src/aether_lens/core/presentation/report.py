@@ -1,6 +1,8 @@
 import asyncio
 import base64
+import importlib.util
 import json
+import shutil
 import time
 import uuid
 from datetime import datetime
@@ -10,10 +12,8 @@ from rich.console import Console
 
 console = Console(stderr=True)
 
-try:
-    from python_on_whales import DockerClient
-except ImportError:
-    DockerClient = None
+# python-on-whales is imported on first SDK use (it is slow to import)
+_HAS_PYTHON_ON_WHALES = importlib.util.find_spec("python_on_whales") is not None
 
 
 def image_to_base64(path):
@@ -209,21 +209,15 @@ def export_to_allure(results, target_dir):
                 attachment_uuid = str(uuid.uuid4()) + ext
                 dst_path = allure_dir / attachment_uuid
 
-                with open(src_path, "rb") as fsrc:
-                    with open(dst_path, "wb") as fdst:
-                        while True:
-                            buf = fsrc.read(1024 * 1024)
-                            if not buf:
-                                break
-                            fdst.write(buf)
+                # Kernel-side copy (sendfile/copy_file_range) where available
+                shutil.copyfile(src_path, dst_path)
 
                 allure_result["attachments"].append(
                     {"name": "Artifact", "source": attachment_uuid, "type": mime}
                 )
 
         result_file = allure_dir / f"{test_uuid}-result.json"
-        with open(result_file, "w") as f:
-            json.dump(allure_result, f, indent=2)
+        result_file.write_bytes(json.dumps(allure_result, indent=2).encode("utf-8"))
 
     return str(allure_dir)
 
@@ -376,7 +370,7 @@ class DockerAllureProvider:
         self.endpoint_url = f"http://localhost:{port}"
 
     async def start(self):
-        if not DockerClient:
+        if not _HAS_PYTHON_ON_WHALES:
             return None
 
         console.print(
@@ -384,6 +378,8 @@ class DockerAllureProvider:
             style="dim",
         )
         try:
+            from python_on_whales import DockerClient
+
             client = DockerClient()
 
             # Check if container exists via SDK
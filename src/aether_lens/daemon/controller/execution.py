@@ -1,15 +1,24 @@
 import asyncio
+import copy
+import functools
+import hashlib
+import importlib.util
 import json
+import os
 import re
+import secrets
+import shlex
 import time
-import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext, suppress
 from pathlib import Path
 from typing import List, Optional
 
 try:
-    from python_on_whales import DockerClient
+    import orjson
 except ImportError:
-    DockerClient = None
+    orjson = None
 
 import httpx
 import logfire
@@ -18,20 +27,96 @@ from rich.console import Console
 from aether_lens.core.domain.events import CallbackTransport, EventEmitter
 from aether_lens.core.domain.models import (
     PipelineLogEvent,
+    TestFinishedEvent,
+    TestProgressEvent,
+    TestStartedEvent,
 )
 from aether_lens.core.presentation import report
 from aether_lens.core.presentation.logging import PipelineFormatter
 from aether_lens.core.presentation.tui import PipelineDashboard
-from aether_lens.daemon.repository.discovery import ToolResolver
+from aether_lens.daemon.repository.discovery import ToolResolver, git_pathspec
 from aether_lens.daemon.repository.environments import (
     DockerEnvironment,
     K8sEnvironment,
     LocalEnvironment,
+    spawn,
 )
 from aether_lens.daemon.repository.executor import TestExecutor
 
 console = Console(stderr=True)
 
+# python-on-whales is imported on first SDK use (it is slow to import)
+_HAS_PYTHON_ON_WHALES = importlib.util.find_spec("python_on_whales") is not None
+
+# Deployment hooks are streamed; only the tail is kept for the caller
+_HOOK_TAIL_LINES = 100
+_HOOK_READ_CHUNK = 64 * 1024
+# Longer unterminated output (e.g. one huge line) is emitted in pieces
+_HOOK_MAX_LINE = 1024 * 1024
+# Progress bars redraw with a bare '\r', so it ends a line too
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+
+# Health check probing: exponential backoff between attempts
+_PROBE_INITIAL_DELAY = 0.05
+_PROBE_BACKOFF_FACTOR = 1.6
+_PROBE_MAX_DELAY = 2.0
+_PROBE_REQUEST_TIMEOUT = 2.0
+
+# Identical diffs (e.g. save-on-focus-loss re-triggers) reuse their analysis
+_ANALYSIS_CACHE_SIZE = 64
+
+
+def _normalize_docker_compose(command: str) -> str:
+    """Rewrite a legacy ``docker-compose`` invocation to ``docker compose``."""
+    if command[:15] == "docker-compose ":
+        return "docker compose " + command[15:]
+    if command == "docker-compose":
+        return "docker compose"
+    return command
+
+
+def _dumps_json(data) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _loads_json(raw: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _tui_on_test_started(event: TestStartedEvent, app):
+    app.update_test_status(event.label, test_status="running")
+    app.log_message(f"[blue]Starting:[/blue] {event.label}")
+
+
+def _tui_on_test_progress(event: TestProgressEvent, app):
+    app.update_test_status(event.label, test_status=event.status_text)
+
+
+def _tui_on_test_finished(event: TestFinishedEvent, app):
+    status_color = "bold green" if event.status == "PASSED" else "bold red"
+    display_status = f"[{status_color}]{event.status}[/{status_color}]"
+    app.update_test_status(event.label, test_status=display_status)
+    app.log_message(f"[{status_color}]Finished:[/{status_color}] {event.label}")
+
+
+def _tui_on_log(event: PipelineLogEvent, app):
+    app.log_message(event.message)
+
+
+# Event class -> dashboard update, used by ExecutionController._handle_event_for_tui
+_TUI_EVENT_HANDLERS = {
+    TestStartedEvent: _tui_on_test_started,
+    TestProgressEvent: _tui_on_test_progress,
+    TestFinishedEvent: _tui_on_test_finished,
+    PipelineLogEvent: _tui_on_log,
+}
+
 
 class ComposeProjectHandle:
     """Handle for an SDK-managed Docker Compose project."""
@@ -67,13 +152,42 @@ class ExecutionController:
         self.lifecycle_registry = lifecycle_registry
         self.cleanup_process = None
         self.orchestrator = None
-
-    def stop_dev_loop(self, target_dir: str) -> bool:
+        # config_path -> ((mtime_ns, size), parsed config)
+        self._config_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+        self._resolved_dirs: dict[str, str] = {}  # absolute input -> realpath
+        # blake2b(diff + planner inputs) -> analysis, least recently used first
+        self._analysis_cache: OrderedDict[bytes, dict] = OrderedDict()
+        # Shared across health checks so retries reuse keep-alive connections
+        self._hc_client: httpx.AsyncClient | None = None
+        self._docker_client = None
+        # compose up/down can block for tens of seconds; keep it off the
+        # default executor shared by every asyncio.to_thread call.
+        # Created on first use and released by close().
+        self._docker_executor: ThreadPoolExecutor | None = None
+        # The controller is a singleton; the shared clients above are only
+        # released once no pipeline (watch mode, MCP, CLI) is using them
+        self._active_pipelines = 0
+
+    async def stop_dev_loop(self, target_dir: str) -> bool:
         """Stop all background services for a target directory."""
         if not self.lifecycle_registry:
             return False
-        target_dir = str(Path(target_dir).resolve())
-        return self.lifecycle_registry.stop(target_dir)
+        target_dir = self.resolve_target_dir(target_dir)
+        return await self.lifecycle_registry.stop(target_dir)
+
+    def resolve_target_dir(self, target_dir: str) -> str:
+        """Return the canonical absolute path for a target directory.
+
+        Absolute inputs are memoized; relative ones depend on the current
+        working directory and are resolved every time.
+        """
+        cached = self._resolved_dirs.get(target_dir)
+        if cached is not None:
+            return cached
+        resolved = os.path.realpath(target_dir)
+        if os.path.isabs(target_dir):
+            self._resolved_dirs[target_dir] = resolved
+        return resolved
 
     async def ensure_services(self, target_dir, config, event_emitter=None):
         """Start defined background services and wait for health checks."""
@@ -84,6 +198,8 @@ class ExecutionController:
         # Global orchestration strategy (sdk is now the default)
         global_strategy = config.get("orchestration_strategy", "sdk")
 
+        # (health_check_url, timeout) collected while starting services
+        pending_checks = []
         for svc in services:
             name = svc.get("name", "Unknown")
             command = svc.get("command")
@@ -98,8 +214,7 @@ class ExecutionController:
             self._emit_log(event_emitter, msg)
 
             # NEW: Normalize binary name early to favor V2 (docker compose)
-            if command.startswith("docker-compose"):
-                command = command.replace("docker-compose", "docker compose", 1)
+            command = _normalize_docker_compose(command)
 
             # Pre-check tool presence using the normalized command
             tool_ok, tool_err = await ToolResolver.check_tool_presence(command)
@@ -116,23 +231,33 @@ class ExecutionController:
             else:
                 proc = await self.start_background_process(command, cwd=target_dir)
 
-            if proc:
-                if self.lifecycle_registry:
-                    self.lifecycle_registry.register(target_dir, proc)
+            if not proc:
+                return False
 
-                if health_check:
-                    timeout = svc.get("timeout_seconds", 30)
-                    if not await self.wait_for_health_check(
-                        health_check, timeout=timeout, event_emitter=event_emitter
-                    ):
-                        return False
-            else:
+            if self.lifecycle_registry:
+                self.lifecycle_registry.register(target_dir, proc)
+
+            if health_check:
+                pending_checks.append((health_check, svc.get("timeout_seconds", 30)))
+
+        # Services are independent once started, so wait for them concurrently
+        if pending_checks:
+            checks = await asyncio.gather(
+                *(
+                    self.wait_for_health_check(
+                        url, timeout=timeout, event_emitter=event_emitter
+                    )
+                    for url, timeout in pending_checks
+                ),
+                return_exceptions=True,
+            )
+            if not all(ok is True for ok in checks):
                 return False
         return True
 
     async def _start_via_sdk(self, command: str, cwd: str = None):
         """Start a service via the Python-on-Whales SDK."""
-        if not DockerClient:
+        if not _HAS_PYTHON_ON_WHALES:
             self._emit_log(
                 None,
                 PipelineFormatter.format_error(
@@ -143,7 +268,7 @@ class ExecutionController:
 
         self._emit_log(None, PipelineFormatter.format_sdk_orchestration_message())
         try:
-            docker_client = DockerClient()
+            docker_client = self._get_docker_client()
 
             if "compose" in command:
                 # Use the SDK to manage compose projects.
@@ -151,13 +276,17 @@ class ExecutionController:
                 compose_files = []
 
                 # Smart discovery of compose files
-                # 1. Check for -f/--file in command
-                m = re.search(r"-f\s+([^\s]+)", command) or re.search(
-                    r"--file\s+([^\s]+)", command
-                )
-                if m:
-                    compose_files = [m.group(1)]
-                else:
+                # 1. Check for -f/--file in command (quoted paths are honoured)
+                tokens = shlex.split(command)
+                for i, tok in enumerate(tokens):
+                    if tok in ("-f", "--file") and i + 1 < len(tokens):
+                        compose_files = [tokens[i + 1]]
+                        break
+                    if tok.startswith("--file="):
+                        compose_files = [tok[len("--file=") :]]
+                        break
+
+                if not compose_files:
                     # 2. Check standard locations
                     for f in [
                         "docker-compose.yml",
@@ -169,12 +298,10 @@ class ExecutionController:
                             compose_files.append(str(project_dir / f))
                             break
 
-                action = "up"
-                if "down" in command:
-                    action = "down"
+                action = "down" if "down" in tokens else "up"
 
                 if action == "up":
-                    await asyncio.to_thread(
+                    await self._run_docker_call(
                         docker_client.compose.up,
                         detach=True,
                         config_files=compose_files if compose_files else None,
@@ -182,7 +309,7 @@ class ExecutionController:
                     # Return a handle for LifecycleRegistry to cleanup later
                     return ComposeProjectHandle(docker_client, compose_files)
                 else:
-                    await asyncio.to_thread(
+                    await self._run_docker_call(
                         docker_client.compose.down,
                         config_files=compose_files if compose_files else None,
                     )
@@ -198,14 +325,45 @@ class ExecutionController:
             )
             return await self.start_background_process(command, cwd=cwd)
 
+    def _get_docker_client(self):
+        """Return the shared SDK client, creating it on first use."""
+        if self._docker_client is None:
+            from python_on_whales import DockerClient
+
+            self._docker_client = DockerClient()
+        return self._docker_client
+
+    async def _run_docker_call(self, func, *args, **kwargs):
+        """Run a blocking Docker SDK call on the dedicated Docker thread pool."""
+        if self._docker_executor is None:
+            self._docker_executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="dockersdk"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._docker_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def close(self):
+        """Release the Docker SDK thread pool; it is recreated on next use."""
+        executor, self._docker_executor = self._docker_executor, None
+        if executor is not None:
+            # Queued calls of an overlapping pipeline still run to completion
+            executor.shutdown(wait=False)
+
     async def start_background_process(self, command, cwd=None):
         """Start a background process using asyncio."""
         # Standardize on V2
-        if command.startswith("docker-compose"):
-            command = command.replace("docker-compose", "docker compose", 1)
+        command = _normalize_docker_compose(command)
 
         try:
-            return await asyncio.create_subprocess_shell(command, cwd=cwd)
+            if os.name == "nt":
+                return await spawn(command, cwd=cwd)
+            # Own session: the child leads its process group, so cleanup can
+            # signal the whole group by pid without an os.getpgid round-trip
+            proc = await spawn(command, cwd=cwd, start_new_session=True)
+            proc.pgid = proc.pid
+            return proc
         except Exception as e:
             self._emit_log(
                 None,
@@ -219,20 +377,38 @@ class ExecutionController:
         """Load and merge configuration from file and overrides."""
         config_path = Path(target_dir) / "aether-lens.config.json"
         config = {}
-        if config_path.exists():
-            try:
-                with open(config_path, "r") as f:
-                    config = json.load(f)
-            except Exception as e:
-                self._emit_log(
-                    None,
-                    PipelineFormatter.format_warning(
-                        f"Failed to load config file: {e}"
-                    ),
-                )
+        try:
+            st = config_path.stat()
+            # The size catches rewrites within the mtime granularity of
+            # coarse-timestamp filesystems
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+
+        if stamp is not None:
+            # Reuse the parsed file until it changes on disk (watch mode
+            # reloads the config on every change event).
+            cache_key = str(config_path)
+            cached = self._config_cache.get(cache_key)
+            if cached and cached[0] == stamp:
+                config = copy.deepcopy(cached[1])
+            else:
+                try:
+                    parsed = _loads_json(config_path.read_bytes())
+                    self._config_cache[cache_key] = (stamp, parsed)
+                    config = copy.deepcopy(parsed)
+                except Exception as e:
+                    self._emit_log(
+                        None,
+                        PipelineFormatter.format_warning(
+                            f"Failed to load config file: {e}"
+                        ),
+                    )
 
         if overrides:
-            config.update({k: v for k, v in overrides.items() if v is not None})
+            for key, value in overrides.items():
+                if value is not None:
+                    config[key] = value
 
         # Set defaults if missing
         config.setdefault("strategy", "auto")
@@ -248,6 +424,7 @@ class ExecutionController:
             return DockerEnvironment(
                 service_name=docker_conf.get("service_name", "app"),
                 project_dir=target_dir,
+                max_parallel=docker_conf.get("max_parallel", 8),
             )
         elif env_type == "k8s":
             k8s_conf = config.get("k8s_config", {})
@@ -255,6 +432,7 @@ class ExecutionController:
                 pod_name=k8s_conf.get("pod_name"),
                 namespace=k8s_conf.get("namespace", "default"),
                 container=k8s_conf.get("container", "aether-lens"),
+                max_parallel=k8s_conf.get("max_parallel", 16),
             )
         return LocalEnvironment()
 
@@ -263,7 +441,7 @@ class ExecutionController:
         history_dir = Path(target_dir) / ".aether" / "history"
         history_dir.mkdir(parents=True, exist_ok=True)
 
-        session_id = str(uuid.uuid4())[:8]
+        session_id = secrets.token_hex(4)
         timestamp = int(time.time())
         filename = f"run_{timestamp}_{session_id}.json"
 
@@ -274,33 +452,75 @@ class ExecutionController:
             "results": results,
         }
 
-        with open(history_dir / filename, "w") as f:
-            json.dump(data, f, indent=2)
+        # Serialize once and reuse the payload for 'latest.json'
+        payload = _dumps_json(data)
+        (history_dir / filename).write_bytes(payload)
 
-        # Also update 'latest.json'
-        with open(history_dir / "latest.json", "w") as f:
-            json.dump(data, f, indent=2)
+        # Swap 'latest.json' atomically so readers never see a partial file
+        tmp_latest = history_dir / f"latest.json.tmp.{os.getpid()}"
+        tmp_latest.write_bytes(payload)
+        os.replace(tmp_latest, history_dir / "latest.json")
 
         self._emit_log(None, PipelineFormatter.format_session_saved(filename))
 
-    async def run_deployment_hook(self, command, cwd=None):
-        """Run an arbitrary command in a subprocess for deployment/setup."""
+    async def run_deployment_hook(self, command, cwd=None, event_emitter=None):
+        """Run an arbitrary command in a subprocess for deployment/setup.
+
+        Output is streamed line by line to the log as it arrives; only the last
+        ``_HOOK_TAIL_LINES`` lines of each stream are kept for the return value.
+        """
         if not command:
             return True, "No command provided"
         self._emit_log(None, PipelineFormatter.format_deployment_hook_start(command))
+        proc = None
         try:
-            proc = await asyncio.create_subprocess_shell(
+            proc = await spawn(
                 command,
                 cwd=cwd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await proc.communicate()
+            out_tail = deque(maxlen=_HOOK_TAIL_LINES)
+            err_tail = deque(maxlen=_HOOK_TAIL_LINES)
+
+            # Bound once: the pump runs per output line of chatty hooks
+            emit = self._emit_log
+            format_output = PipelineFormatter.format_deployment_hook_output
+
+            def _emit_lines(lines, tail):
+                for raw in lines:
+                    line = raw.decode("utf-8", "replace").rstrip()
+                    tail.append(line)
+                    emit(event_emitter, format_output(line))
+
+            async def _pump(stream, tail):
+                # Read in chunks rather than readline(), which aborts on lines
+                # longer than the stream limit
+                pending = b""
+                while chunk := await stream.read(_HOOK_READ_CHUNK):
+                    data = pending + chunk
+                    # A trailing '\r' may be the first half of '\r\n'
+                    held = b"\r" if data.endswith(b"\r") else b""
+                    lines = _LINE_BREAK.split(data[: len(data) - len(held)])
+                    pending = lines.pop() + held
+                    if len(pending) > _HOOK_MAX_LINE:
+                        lines.append(pending)
+                        pending = b""
+                    _emit_lines(lines, tail)
+                pending = pending.rstrip(b"\r")
+                if pending:
+                    _emit_lines((pending,), tail)
+
+            await asyncio.gather(
+                _pump(proc.stdout, out_tail), _pump(proc.stderr, err_tail)
+            )
+            await proc.wait()
+
             if proc.returncode == 0:
                 self._emit_log(None, PipelineFormatter.format_deployment_hook_success())
-                return True, stdout.decode().strip()
+                return True, "\n".join(out_tail).strip()
             else:
-                err = stderr.decode().strip()
+                err = "\n".join(err_tail).strip()
                 self._emit_log(
                     None, PipelineFormatter.format_deployment_hook_failure(err)
                 )
@@ -310,6 +530,12 @@ class ExecutionController:
                 None, PipelineFormatter.format_error(f"Deployment Error: {e}")
             )
             return False, str(e)
+        finally:
+            # Never leave a hook running with nobody draining its pipes
+            if proc is not None and proc.returncode is None:
+                with suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
 
     async def wait_for_health_check(self, url, timeout=30, event_emitter=None):
         if not url:
@@ -318,29 +544,82 @@ class ExecutionController:
         msg = PipelineFormatter.format_health_check_start(url)
         self._emit_log(event_emitter, msg)
 
-        start_time = time.time()
-        async with httpx.AsyncClient(trust_env=False) as client:
-            while time.time() - start_time < timeout:
-                try:
-                    resp = await client.get(url)
-                    if resp.status_code == 200:
-                        ok_msg = PipelineFormatter.format_health_check_success()
-                        self._emit_log(event_emitter, ok_msg)
-                        return True
-                except Exception:
-                    pass
-                await asyncio.sleep(1)
-
-        err_msg = PipelineFormatter.format_health_check_timeout()
-        self._emit_log(event_emitter, err_msg)
-        return False
-
-    async def get_git_diff(self, target_dir):
         try:
+            await asyncio.wait_for(self._probe_until_ok(url), timeout=timeout)
+        except asyncio.TimeoutError:
+            err_msg = PipelineFormatter.format_health_check_timeout()
+            self._emit_log(event_emitter, err_msg)
+            return False
+
+        ok_msg = PipelineFormatter.format_health_check_success()
+        self._emit_log(event_emitter, ok_msg)
+        return True
+
+    async def _probe_until_ok(self, url):
+        """Poll the health check URL with exponential backoff until HTTP 200."""
+        delay = _PROBE_INITIAL_DELAY
+        while True:
+            try:
+                # Looked up per attempt so a client closed by a concurrent
+                # pipeline is transparently replaced.
+                resp = await self._get_health_check_client().get(url)
+                if resp.status_code == 200:
+                    return
+                # The server is answering, so it should be close to ready
+                delay = _PROBE_INITIAL_DELAY
+            except Exception:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * _PROBE_BACKOFF_FACTOR, _PROBE_MAX_DELAY)
+
+    def _get_health_check_client(self) -> httpx.AsyncClient:
+        """Return the shared health check client, creating it on first use."""
+        if self._hc_client is None or self._hc_client.is_closed:
+            self._hc_client = httpx.AsyncClient(
+                trust_env=False,
+                timeout=httpx.Timeout(_PROBE_REQUEST_TIMEOUT),
+                limits=httpx.Limits(max_connections=20),
+            )
+        return self._hc_client
+
+    async def aclose(self):
+        """Close the shared health check client and the Docker SDK pool."""
+        if self._hc_client is not None:
+            await self._hc_client.aclose()
+            self._hc_client = None
+        self.close()
+
+    async def _has_git_changes(self, target_dir, paths=None) -> bool:
+        """Cheaply check for changes against HEAD without materializing the diff."""
+        try:
+            git_dirs = await ToolResolver.git_dir_args(target_dir)
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                *git_dirs,
+                "diff",
+                "--quiet",
+                "HEAD",
+                *git_pathspec(paths),
+                cwd=target_dir,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            # 0 = clean; 1 = changes; anything else is a git error, in which
+            # case let get_git_diff decide.
+            return await proc.wait() != 0
+        except OSError:
+            # git could not be spawned; let get_git_diff decide as well
+            return True
+
+    async def get_git_diff(self, target_dir, paths=None):
+        try:
+            git_dirs = await ToolResolver.git_dir_args(target_dir)
             proc = await asyncio.create_subprocess_exec(
                 "git",
+                *git_dirs,
                 "diff",
                 "HEAD",
+                *git_pathspec(paths),
                 cwd=target_dir,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
@@ -350,7 +629,6 @@ class ExecutionController:
         except Exception:
             return ""
 
-    @logfire.instrument("Aether Lens Pipeline")
     async def run_pipeline(
         self,
         target_dir: str,
@@ -361,87 +639,121 @@ class ExecutionController:
         context: str = "watch",
         auto_watch: bool = False,
         custom_instruction: str = None,
+        instrument: bool = True,
+        changed_paths=None,
         **kwargs,
     ):
-        """Unified entry point for the pipeline flow."""
-        target_dir = str(Path(target_dir or ".").resolve())
-
-        try:
-            # Phase 1: Preparation
-            self._emit_phase_log(event_emitter, "PREPARATION")
-            if auto_watch and self.orchestrator:
-                await self.orchestrator.start_watch(
-                    target_dir,
-                    strategy=strategy,
-                    interactive=interactive,
-                    event_emitter=event_emitter,
-                )
-
-            config = self.load_config(
-                target_dir, overrides=kwargs
-            )  # Use kwargs for overrides
-            env_runner = self._create_execution_environment(config, target_dir)
-
-            # Unified Intro message
-            self._emit_log(
-                event_emitter,
-                PipelineFormatter.get_intro_panel(target_dir, config["strategy"]),
-            )
+        """Unified entry point for the pipeline flow.
+
+        Watch-triggered reruns pass ``instrument=False`` so that a busy watch
+        session does not open (and export) a logfire span per file save, and
+        ``changed_paths`` (the debounced batch) so only those files are diffed.
+        """
+        target_dir = self.resolve_target_dir(target_dir or ".")
+        span = logfire.span("Aether Lens Pipeline") if instrument else nullcontext()
+        with span:
+            self._active_pipelines += 1
+            try:
+                # Phase 1: Preparation
+                self._emit_phase_log(event_emitter, "PREPARATION")
+                if auto_watch and self.orchestrator:
+                    await self.orchestrator.start_watch(
+                        target_dir,
+                        strategy=strategy,
+                        interactive=interactive,
+                        event_emitter=event_emitter,
+                    )
 
-            if not await self._prepare_services(target_dir, config, event_emitter):
-                return
+                config = self.load_config(
+                    target_dir, overrides=kwargs
+                )  # Use kwargs for overrides
+                env_runner = self._create_execution_environment(config, target_dir)
 
-            # Phase 2: Analysis & Selection
-            diff = "" if context == "cli" else await self.get_git_diff(target_dir)
-            if context != "cli" and not diff:
+                # Unified Intro message
                 self._emit_log(
                     event_emitter,
-                    PipelineFormatter.format_warning(
-                        "No changes detected. Skipping analysis."
-                    ),
+                    PipelineFormatter.get_intro_panel(target_dir, config["strategy"]),
                 )
-                return
 
-            self._emit_phase_log(event_emitter, "ANALYSIS")
-            analysis = self.planner.run_analysis(
-                diff, context, config["strategy"], custom_instruction
-            )
-            all_tests = analysis.get("recommended_tests", [])
+                if not await self._prepare_services(target_dir, config, event_emitter):
+                    return
+
+                # Phase 2: Analysis & Selection
+                diff = ""
+                paths = sorted(map(os.path.abspath, changed_paths or ()))
+                if context != "cli" and await self._has_git_changes(target_dir, paths):
+                    diff = await self.get_git_diff(target_dir, paths)
+                if context != "cli" and not diff:
+                    self._emit_log(
+                        event_emitter,
+                        PipelineFormatter.format_warning(
+                            "No changes detected. Skipping analysis."
+                        ),
+                    )
+                    return
 
-            if not all_tests:
-                self._emit_log(
-                    event_emitter,
-                    PipelineFormatter.format_warning(
-                        "No tests recommended. Using fallback audit."
-                    ),
+                self._emit_phase_log(event_emitter, "ANALYSIS")
+                analysis = self._run_analysis(
+                    diff, context, config["strategy"], custom_instruction
                 )
-                all_tests = [self._get_fallback_test()]
-
-            # Phase 3: Quality Guard
-            all_tests = self._inject_quality_tests(config, all_tests, event_emitter)
+                all_tests = analysis.get("recommended_tests", [])
+
+                if not all_tests:
+                    self._emit_log(
+                        event_emitter,
+                        PipelineFormatter.format_warning(
+                            "No tests recommended. Using fallback audit."
+                        ),
+                    )
+                    all_tests = [self._get_fallback_test()]
 
-            # Phase 4: Execution
-            self._emit_phase_log(event_emitter, "EXECUTION")
-            results = await self._execute_tests(
-                all_tests,
-                config["strategy"],
-                target_dir,
-                event_emitter,
-                config.get("app_url"),
-                interactive,
-                environment=env_runner,
-            )
+                # Phase 3: Quality Guard
+                all_tests = self._inject_quality_tests(config, all_tests, event_emitter)
 
-            # Phase 5: Result Persistence & Reporting
-            self.save_test_session(target_dir, results, config["strategy"])
-            if config.get("allure_strategy") != "none":
-                report.export_to_allure(results, target_dir)
+                # Phase 4: Execution
+                self._emit_phase_log(event_emitter, "EXECUTION")
+                results = await self._execute_tests(
+                    all_tests,
+                    config["strategy"],
+                    target_dir,
+                    event_emitter,
+                    config.get("app_url"),
+                    interactive,
+                    environment=env_runner,
+                )
 
-            return results
-        finally:
-            if context == "cli":
-                self._emit_phase_log(event_emitter, "CLEANUP")
-                self.stop_dev_loop(target_dir)
+                # Phase 5: Result Persistence & Reporting
+                self.save_test_session(target_dir, results, config["strategy"])
+                if config.get("allure_strategy") != "none":
+                    report.export_to_allure(results, target_dir)
+
+                return results
+            finally:
+                self._active_pipelines -= 1
+                if not self._active_pipelines:
+                    await self.aclose()
+                if context == "cli":
+                    self._emit_phase_log(event_emitter, "CLEANUP")
+                    await self.stop_dev_loop(target_dir)
+
+    def _run_analysis(self, diff, context, strategy, custom_instruction):
+        """Run the planner, reusing the result for an already-analyzed diff."""
+        h = hashlib.blake2b(diff.encode(), digest_size=16)
+        h.update(f"\0{context}\0{strategy}\0{custom_instruction or ''}".encode())
+        key = h.digest()
+
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+        else:
+            cached = self.planner.run_analysis(
+                diff, context, strategy, custom_instruction
+            )
+            self._analysis_cache[key] = cached
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        # Callers extend the test list; keep the cached plan pristine
+        return copy.deepcopy(cached)
 
     async def _prepare_services(self, target_dir, config, event_emitter):
         """Handle service orchestration and deployment hooks."""
@@ -457,7 +769,9 @@ class ExecutionController:
         if deploy_conf:
             cmd = deploy_conf.get("command")
             if cmd:
-                success, msg = await self.run_deployment_hook(cmd, cwd=target_dir)
+                success, msg = await self.run_deployment_hook(
+                    cmd, cwd=target_dir, event_emitter=event_emitter
+                )
                 if not success:
                     self._emit_error_log(
                         event_emitter, f"Deployment Hook failed: {msg}"
@@ -482,11 +796,21 @@ class ExecutionController:
         q_tests = []
         for provider in q_conf.get("providers", []):
             if provider == "ruff":
+                # Lint and format checks are independent; emitting them as
+                # separate tests lets _execute_tests run them concurrently.
                 q_tests.append(
                     {
                         "type": "command",
-                        "label": "Quality Guard (Ruff)",
-                        "command": "ruff check . && ruff format --check .",
+                        "label": "Quality Guard (Ruff Lint)",
+                        "command": "ruff check .",
+                        "execution_env": "local",
+                    }
+                )
+                q_tests.append(
+                    {
+                        "type": "command",
+                        "label": "Quality Guard (Ruff Format)",
+                        "command": "ruff format --check .",
                         "execution_env": "local",
                     }
                 )
@@ -557,8 +881,16 @@ class ExecutionController:
                 current_emitter,
                 environment=environment,
             )
-            tasks = [executor.execute_test(t, strategy, app_url) for t in tests]
-            results = await asyncio.gather(*tasks)
+
+            on_done = None
+            if app_instance:
+
+                def on_done(finished, total):
+                    app_instance.update_phase_status(f"EXECUTION ({finished}/{total})")
+
+            results = await executor.execute_tests(
+                tests, strategy, app_url, on_done=on_done
+            )
             return results
 
         if use_tui and not event_emitter:
@@ -574,29 +906,9 @@ class ExecutionController:
         return results
 
     def _handle_event_for_tui(self, event, app):
-        if hasattr(event, "type"):
-            etype = getattr(event, "type")
-        else:
-            return
-
-        if etype == "test_started":
-            label = getattr(event, "label", "Unknown")
-            app.update_test_status(label, test_status="running")
-            app.log_message(f"[blue]Starting:[/blue] {label}")
-        elif etype == "test_progress":
-            label = getattr(event, "label", "Unknown")
-            status_text = getattr(event, "status_text", "")
-            app.update_test_status(label, test_status=status_text)
-        elif etype == "test_finished":
-            label = getattr(event, "label", "Unknown")
-            status = getattr(event, "status", "UNKNOWN")
-            status_color = "bold green" if status == "PASSED" else "bold red"
-            display_status = f"[{status_color}]{status}[/{status_color}]"
-            app.update_test_status(label, test_status=display_status)
-            app.log_message(f"[{status_color}]Finished:[/{status_color}] {label}")
-        elif etype == "log":
-            message = getattr(event, "message", "")
-            app.log_message(message)
+        handler = _TUI_EVENT_HANDLERS.get(type(event))
+        if handler:
+            handler(event, app)
 
     def _emit_phase_log(self, event_emitter, phase: str):
         msg = PipelineFormatter.format_phase(phase)
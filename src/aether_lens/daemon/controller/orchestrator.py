@@ -1,5 +1,4 @@
 import asyncio
-from pathlib import Path
 
 from aether_lens.daemon.controller.execution import ExecutionController
 from aether_lens.daemon.controller.watcher import start_watcher
@@ -19,8 +18,10 @@ class AetherOrchestrator:
     async def start_background_process(self, command, cwd=None):
         return await self.execution_ctrl.start_background_process(command, cwd=cwd)
 
-    async def run_deployment_hook(self, command, cwd=None):
-        return await self.execution_ctrl.run_deployment_hook(command, cwd=cwd)
+    async def run_deployment_hook(self, command, cwd=None, event_emitter=None):
+        return await self.execution_ctrl.run_deployment_hook(
+            command, cwd=cwd, event_emitter=event_emitter
+        )
 
     async def wait_for_health_check(self, url, timeout=30, event_emitter=None):
         return await self.execution_ctrl.wait_for_health_check(
@@ -29,31 +30,34 @@ class AetherOrchestrator:
 
     async def start_watch(self, target_dir: str, strategy="auto", interactive=True):
         """Start a local watch-and-run loop."""
-        target_path = Path(target_dir).resolve()
-        target_dir_str = str(target_path)
+        target_dir_str = self.execution_ctrl.resolve_target_dir(target_dir)
 
         if target_dir_str in self._watchers:
             return self._watchers[target_dir_str]
 
         loop = asyncio.get_running_loop()
 
-        async def _on_watch_change(path):
+        async def _on_watch_change(paths):
             await self.execution_ctrl.run_pipeline(
-                target_dir=str(target_path), strategy=strategy, interactive=interactive
+                target_dir=target_dir_str,
+                strategy=strategy,
+                interactive=interactive,
+                instrument=False,
+                changed_paths=paths,
             )
 
-        def on_change(path):
-            # No need for complex logic here, WatchController will handle thread-safety
-            # But we wrap it in a task just in case it's not a coroutine
-            loop.create_task(_on_watch_change(path))
-
+        # Awaited by the watcher's consumer, so runs never overlap
         observer = start_watcher(
-            str(target_path), on_change, blocking=False, orchestrator=self, loop=loop
+            target_dir_str,
+            _on_watch_change,
+            blocking=False,
+            orchestrator=self,
+            loop=loop,
         )
         self._watchers[target_dir_str] = observer
 
         if self.execution_ctrl.lifecycle_registry:
-            self.execution_ctrl.lifecycle_registry.register(str(target_path), observer)
+            self.execution_ctrl.lifecycle_registry.register(target_dir_str, observer)
         return observer
 
     async def start_loop(
@@ -66,10 +70,10 @@ class AetherOrchestrator:
         browser_url=None,
     ):
         """Start a remote heavy development loop (Sync & Remote Test)."""
-        target_path = Path(target_dir).resolve()
+        target_dir_str = self.execution_ctrl.resolve_target_dir(target_dir)
 
         handler = LocalLensLoopHandler(
-            target_dir=str(target_path),
+            target_dir=target_dir_str,
             pod_name=pod_name,
             namespace=namespace,
             remote_path=remote_path,
@@ -80,19 +84,14 @@ class AetherOrchestrator:
         # Initial sync
         await handler.sync_and_trigger()
 
-        async def _on_sync_change(path):
-            await handler.sync_and_trigger(path)
-
-        def on_change(path):
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(_on_sync_change(path))
-            except RuntimeError:
-                asyncio.run(_on_sync_change(path))
-
+        # Awaited by the watcher's consumer, so syncs never overlap
         observer = start_watcher(
-            str(target_path), on_change, blocking=False, orchestrator=self
+            target_dir_str,
+            handler.sync_and_trigger,
+            blocking=False,
+            orchestrator=self,
+            loop=asyncio.get_running_loop(),
         )
         if self.execution_ctrl.lifecycle_registry:
-            self.execution_ctrl.lifecycle_registry.register(str(target_path), observer)
+            self.execution_ctrl.lifecycle_registry.register(target_dir_str, observer)
         return observer
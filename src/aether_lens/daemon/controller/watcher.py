@@ -1,77 +1,144 @@
 import asyncio
-import time
+import errno
+import os
+import threading
 
 from rich.console import Console
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 console = Console(stderr=True)
 
+# Directory names whose contents never trigger the watch callback
+IGNORED_DIR_NAMES = frozenset(
+    {".git", "node_modules", ".astro", "__pycache__", ".aether"}
+)
+WATCHED_EVENT_TYPES = frozenset({"created", "modified", "deleted", "moved"})
+# inotify watch/instance limits reached (fs.inotify.max_user_watches etc.)
+_WATCH_LIMIT_ERRNOS = frozenset({errno.ENOSPC, errno.EMFILE})
+
 
 class WatchController(FileSystemEventHandler):
     """
     Unified controller for file watching and deployment lifecycle.
+
+    Events are collected into a batch and the callback fires once, with the
+    set of changed paths, after ``debounce_seconds`` without new events.
+    Coroutine callbacks are awaited one at a time: changes seen while a run
+    is in flight accumulate and are delivered as a single follow-up batch.
     """
 
     def __init__(
         self,
         target_dir,
         on_change_callback,
-        debounce_seconds=2,
+        debounce_seconds=0.5,
         orchestrator=None,
         loop=None,
     ):
         self.target_dir = target_dir
         self.on_change_callback = on_change_callback
+        self._callback_is_coro = asyncio.iscoroutinefunction(on_change_callback)
         self.debounce_seconds = debounce_seconds
         self.orchestrator = orchestrator
         self.loop = loop or asyncio.get_event_loop()
-        self.last_triggered = 0
         self.observer = None
+        # The DI container builds a controller without a target directory
+        self._ignored_prefixes = (
+            tuple(os.path.join(target_dir, name) + os.sep for name in IGNORED_DIR_NAMES)
+            if target_dir
+            else ()
+        )
+        # Written by the watchdog thread, drained on the event loop thread
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._generation = 0
+        self._wake = asyncio.Event()
+        self._consumer_task = None
 
     def on_any_event(self, event):
-        if event.is_directory or event.event_type not in [
-            "created",
-            "modified",
-            "deleted",
-            "moved",
-        ]:
+        if event.is_directory or event.event_type not in WATCHED_EVENT_TYPES:
             return
 
-        # Simple ignore list
-        if any(
-            x in event.src_path
-            for x in [".git", "node_modules", ".astro", "__pycache__", ".aether"]
-        ):
+        # Ignore events under tool/VCS directories (whole path components only,
+        # so e.g. ".gitignore" or "my.aether.txt" are still watched). Top-level
+        # ones are a single C-level prefix test; nested ones need the split.
+        src_path = event.src_path
+        if src_path.startswith(self._ignored_prefixes):
+            return
+        if not IGNORED_DIR_NAMES.isdisjoint(src_path.split(os.sep)):
             return
 
-        console.print(f"[Watcher] Event: {event.event_type} on {event.src_path}")
-        current_time = time.time()
-        if (current_time - self.last_triggered) > self.debounce_seconds:
-            console.print(f"[Watcher] TRIGGERING callback for {event.src_path}")
-            self.last_triggered = current_time
-
-            if asyncio.iscoroutinefunction(self.on_change_callback):
-                asyncio.run_coroutine_threadsafe(
-                    self.on_change_callback(event.src_path), self.loop
-                )
-            else:
-                self.loop.call_soon_threadsafe(
-                    lambda: self.on_change_callback(event.src_path)
-                )
+        console.print(f"[Watcher] Event: {event.event_type} on {src_path}")
+        with self._pending_lock:
+            first = not self._pending
+            self._pending.add(src_path)
+            self._generation += 1
+        # Only the first event of a batch hops to the loop thread
+        if first:
+            self.loop.call_soon_threadsafe(self._wake.set)
 
-    def start(self, blocking=True):
-        self.observer = Observer()
+    def _start_consumer(self):
+        if self._consumer_task is None:
+            self._consumer_task = self.loop.create_task(self._consume())
+
+    async def _consume(self):
+        """Wait for events, debounce them and hand each batch to the callback."""
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            # Trailing-edge debounce: keep waiting while events still arrive
+            while True:
+                seen = self._generation
+                await asyncio.sleep(self.debounce_seconds)
+                if self._generation == seen:
+                    break
+
+            with self._pending_lock:
+                batch, self._pending = self._pending, set()
+            if not batch:
+                continue
+
+            console.print(f"[Watcher] TRIGGERING callback for {len(batch)} change(s)")
+            # The callback is arbitrary work (pipeline runs, syncs); whatever
+            # it raises, the consumer must survive to deliver the next batch
+            try:
+                if self._callback_is_coro:
+                    await self.on_change_callback(batch)
+                else:
+                    self.on_change_callback(batch)
+            except Exception:  # noqa: BLE001
+                console.print("[bold red][Watcher] Callback failed:[/bold red]")
+                console.print_exception()
+
+    def _start_observer(self, observer_cls):
+        self.observer = observer_cls()
         self.observer.schedule(self, self.target_dir, recursive=True)
         self.observer.start()
+
+    def start(self, blocking=True):
+        try:
+            self._start_observer(Observer)
+        except OSError as e:
+            if e.errno not in _WATCH_LIMIT_ERRNOS:
+                raise
+            # Native watches would silently miss parts of the tree; poll instead
+            self.observer.stop()
+            console.print(
+                f"[yellow][Watcher] Native file watch limit reached ({e.strerror}); "
+                "falling back to polling. Raise fs.inotify.max_user_watches "
+                "for lower latency.[/yellow]"
+            )
+            self._start_observer(PollingObserver)
+        self.loop.call_soon_threadsafe(self._start_consumer)
         console.print(f"[Watcher] Watching {self.target_dir} for changes...")
 
         if not blocking:
             return self.observer
 
         try:
-            while True:
-                time.sleep(1)
+            self.observer.join()
         except KeyboardInterrupt:
             self.stop()
 
@@ -79,6 +146,8 @@ class WatchController(FileSystemEventHandler):
         if self.observer:
             self.observer.stop()
             self.observer.join()
+        if self._consumer_task:
+            self.loop.call_soon_threadsafe(self._consumer_task.cancel)
 
 
 def start_watcher(target_dir, callback, blocking=True, orchestrator=None, loop=None):
@@ -1,15 +1,47 @@
 import asyncio
+import sys
+import threading
 
 from dependency_injector.wiring import Provide, inject
 from rich.console import Console
 
 from aether_lens.core.containers import Container
+from aether_lens.core.eventloop import new_event_loop
 from aether_lens.daemon.controller.watcher import start_watcher
 from aether_lens.daemon.registry import register_loop
 
 console = Console(stderr=True)
 
 
+class AsyncEventLoopThread:
+    """
+    Runs one event loop for the lifetime of the daemon on a background thread.
+
+    Uses uvloop when installed. On Python 3.12+ tasks are created eagerly, so
+    a watch callback runs inline up to its first real suspension point.
+    """
+
+    def __init__(self):
+        self.loop = new_event_loop()
+        if sys.version_info >= (3, 12):
+            self.loop.set_task_factory(asyncio.eager_task_factory)
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="aether-loop", daemon=True
+        )
+
+    def start(self):
+        self.thread.start()
+        return self.loop
+
+    def run(self, coro):
+        """Run a coroutine on the loop thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
 @inject
 def run_loop_daemon(
     target_dir,
@@ -38,14 +70,19 @@ def run_loop_daemon(
         browser_url=browser_url,
     )
 
-    # Initial sync
-    asyncio.run(handler.sync_and_trigger())
+    loop_thread = AsyncEventLoopThread()
+    loop = loop_thread.start()
 
-    async def on_change(path):
-        await handler.sync_and_trigger(path)
+    # Initial sync
+    loop_thread.run(handler.sync_and_trigger())
 
-    observer = start_watcher(target_dir, on_change, blocking=blocking)
+    # The watcher's consumer task awaits each batch on the loop thread
+    observer = start_watcher(
+        target_dir, handler.sync_and_trigger, blocking=blocking, loop=loop
+    )
 
     if not blocking:
         register_loop(target_dir, observer)
         return observer
+
+    loop_thread.stop()
@@ -1,27 +1,24 @@
-import threading
-
 _active_loops = {}
-_lock = threading.Lock()
 
 
+# Plain dict operations are atomic under the GIL; observers are stopped and
+# joined after they leave the registry so a slow join never blocks others.
 def register_loop(target_dir, observer):
-    with _lock:
-        if target_dir in _active_loops:
-            _active_loops[target_dir].stop()
-            _active_loops[target_dir].join()
-        _active_loops[target_dir] = observer
+    previous = _active_loops.pop(target_dir, None)
+    _active_loops[target_dir] = observer
+    if previous is not None:
+        previous.stop()
+        previous.join()
 
 
 def stop_loop(target_dir):
-    with _lock:
-        if target_dir in _active_loops:
-            observer = _active_loops.pop(target_dir)
-            observer.stop()
-            observer.join()
-            return True
+    observer = _active_loops.pop(target_dir, None)
+    if observer is None:
         return False
+    observer.stop()
+    observer.join()
+    return True
 
 
 def list_loops():
-    with _lock:
-        return list(_active_loops.keys())
+    return list(_active_loops)
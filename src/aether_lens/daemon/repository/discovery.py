@@ -1,29 +1,135 @@
+import asyncio
+import os
 import shutil
-from pathlib import Path
-from typing import Optional
+import stat
+
+# Fallback locations probed when PATH lookup fails
+_COMMON_BIN_DIRS = ("/usr/local/bin", "/usr/bin", "/bin")
+
+# (name, PATH) -> resolved path. Only hits are cached, so a tool installed
+# while a long-lived daemon runs is found on the next lookup, and a PATH
+# change resolves names afresh.
+_found_executables: dict[tuple[str, str], str] = {}
+
+# target dir -> ["--git-dir", ..., "--work-tree", ...] from one rev-parse
+_git_dirs: dict[str, list[str]] = {}
+
+# Beyond this many characters a pathspec risks E2BIG (ARG_MAX, or the 32K
+# Windows command line); such batches are diffed unscoped instead
+_MAX_PATHSPEC_CHARS = 16 * 1024
+
+# (PATH value, {name: first matching path}) built from one scandir per entry
+_path_index = None
+
+
+def _current_path() -> str:
+    return os.environ.get("PATH", os.defpath)
+
+
+def _get_path_index() -> dict:
+    """Map file names on PATH to their first occurrence, rebuilt if PATH changes."""
+    global _path_index
+    path_env = _current_path()
+    if _path_index is None or _path_index[0] != path_env:
+        index = {}
+        for bin_dir in path_env.split(os.pathsep):
+            try:
+                with os.scandir(bin_dir or os.curdir) as entries:
+                    for entry in entries:
+                        index.setdefault(entry.name, entry.path)
+            except OSError:
+                continue
+        _path_index = (path_env, index)
+    return _path_index[1]
+
+
+def git_pathspec(paths) -> list[str]:
+    """``["--", *paths]`` for a git command, or [] (whole tree) if too long."""
+    if not paths:
+        return []
+    if sum(len(p) + 1 for p in paths) > _MAX_PATHSPEC_CHARS:
+        return []
+    return ["--", *paths]
 
 
 class ToolResolver:
     """Handles discovery and validation of external tools and executables."""
 
     @staticmethod
-    def find_executable(name: str) -> Optional[str]:
-        """Find an executable in the system path."""
+    def find_executable(name: str) -> str | None:
+        """Find an executable in the system path (found paths are cached)."""
+        key = (name, _current_path())
+        found = _found_executables.get(key)
+        if found is not None:
+            return found
+        found = ToolResolver._lookup(name)
+        if found is not None:
+            _found_executables[key] = found
+        return found
+
+    @staticmethod
+    def _lookup(name: str) -> str | None:
+        candidate = None
+        if os.name != "nt" and os.sep not in name:
+            candidate = _get_path_index().get(name)
+        if candidate and os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+
+        # Shadowed non-executables, explicit paths and PATHEXT lookups
         exe_path = shutil.which(name)
         if exe_path:
             return str(exe_path)
 
-        # Fallback for common locations if which fails
-        common_paths = [
-            Path("/usr/local/bin") / name,
-            Path("/usr/bin") / name,
-            Path("/bin") / name,
-        ]
-        for path in common_paths:
-            if path.exists():
-                return str(path)
+        # Fallback for common locations if which fails (one stat per candidate)
+        for bin_dir in _COMMON_BIN_DIRS:
+            candidate = os.path.join(bin_dir, name)
+            try:
+                st = os.stat(candidate)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                return candidate
         return None
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached lookups, e.g. after PATH or installed tools change."""
+        global _path_index
+        _path_index = None
+        _found_executables.clear()
+        _git_dirs.clear()
+
+    @staticmethod
+    async def git_dir_args(target_dir: str) -> list[str]:
+        """Explicit git dir/work tree flags so git skips repository discovery.
+
+        Returns an empty list (uncached) when target_dir is not inside a repo.
+        """
+        key = str(target_dir)
+        cached = _git_dirs.get(key)
+        if cached is not None:
+            return cached
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                "-C",
+                key,
+                "rev-parse",
+                "--absolute-git-dir",
+                "--show-toplevel",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await proc.communicate()
+        except OSError:
+            return []
+        lines = stdout.decode().splitlines()
+        if proc.returncode != 0 or len(lines) != 2:
+            return []
+        args = ["--git-dir", lines[0], "--work-tree", lines[1]]
+        _git_dirs[key] = args
+        return args
+
     @staticmethod
     async def check_tool_presence(command: str) -> tuple[bool, str]:
         """Check if the required tool is available using Path/shutil."""
@@ -34,11 +140,14 @@ class ToolResolver:
         first_word = words[0]
 
         # Handling 'docker compose' as a single tool concept
-        if first_word == "docker" and len(words) > 1 and words[1] == "compose":
-            if ToolResolver.find_executable("docker"):
-                return True, ""
-            return False, "Command 'docker' (required for 'docker compose') not found."
+        is_compose = first_word == "docker" and len(words) > 1 and words[1] == "compose"
+        if (first_word, _current_path()) in _found_executables:
+            return True, ""
 
-        if ToolResolver.find_executable(first_word):
+        # A cold lookup stats PATH entries; keep it off the event loop
+        if await asyncio.to_thread(ToolResolver.find_executable, first_word):
             return True, ""
+
+        if is_compose:
+            return False, "Command 'docker' (required for 'docker compose') not found."
         return False, f"Command '{first_word}' not found in PATH."
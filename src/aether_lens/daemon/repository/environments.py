@@ -1,64 +1,268 @@
 import asyncio
+import functools
+import importlib.util
+import os
+import shlex
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Tuple
+from typing import Any
 
-try:
-    from python_on_whales import DockerClient
-except ImportError:
-    DockerClient = None
+# Optional clients are slow to import; they are loaded on first use only
+_HAS_KUBERNETES = importlib.util.find_spec("kubernetes") is not None
+_HAS_PYTHON_ON_WHALES = importlib.util.find_spec("python_on_whales") is not None
+
+# Characters that require a real shell to interpret the command
+_SHELL_METACHARS = frozenset("|&;<>()$`*?[]{}~#\\\n")
+# Builtins and keywords have no executable to exec (e.g. "cd dir", "source .env")
+_SHELL_BUILTINS = frozenset(
+    {
+        ".",
+        ":",
+        "alias",
+        "break",
+        "case",
+        "cd",
+        "command",
+        "continue",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "for",
+        "hash",
+        "if",
+        "local",
+        "read",
+        "readonly",
+        "return",
+        "set",
+        "shift",
+        "source",
+        "trap",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "unset",
+        "until",
+        "wait",
+        "while",
+    }
+)
+
+
+async def spawn(command: str | list[str], shell: bool = False, **kwargs):
+    """Spawn a command, skipping the intermediate /bin/sh when possible.
+
+    An argv list is always executed directly. Command strings that rely on
+    shell features (pipes, redirects, expansion, ``VAR=value`` prefixes,
+    builtins) or pass ``shell=True`` still go through
+    ``create_subprocess_shell``, as does every string on Windows, where
+    ``npm``/``npx`` are ``.cmd`` shims that cannot be exec'd directly.
+    """
+    if isinstance(command, list):
+        return await asyncio.create_subprocess_exec(*command, **kwargs)
+    if not shell and os.name != "nt" and not _SHELL_METACHARS.intersection(command):
+        argv = shlex.split(command)
+        if argv and "=" not in argv[0] and argv[0] not in _SHELL_BUILTINS:
+            return await asyncio.create_subprocess_exec(*argv, **kwargs)
+    return await asyncio.create_subprocess_shell(command, **kwargs)
+
+
+# Captured command output is capped per stream; the head is kept
+_MAX_CAPTURE_BYTES = 4 * 1024 * 1024
+_READ_CHUNK = 64 * 1024
+
+
+async def _drain(reader, buf: bytearray):
+    truncated = False
+    # Keep reading past the cap so the child never blocks on a full pipe
+    while chunk := await reader.read(_READ_CHUNK):
+        room = _MAX_CAPTURE_BYTES - len(buf)
+        if room >= len(chunk):
+            buf += chunk
+        else:
+            buf += chunk[:room]
+            truncated = True
+    if truncated:
+        buf += b"\n... [output truncated]"
+
+
+async def _collect_output(proc) -> tuple[bytearray, bytearray]:
+    """Stream stdout/stderr of ``proc`` into bounded buffers until it exits."""
+    stdout, stderr = bytearray(), bytearray()
+    await asyncio.gather(
+        _drain(proc.stdout, stdout), _drain(proc.stderr, stderr), proc.wait()
+    )
+    return stdout, stderr
+
+
+def _remote_argv(command: str | list[str]) -> list[str]:
+    # Strings may use shell syntax, so they run under the remote sh;
+    # an argv list is executed as-is without an extra shell process
+    if isinstance(command, list):
+        return command
+    return ["sh", "-c", command]
+
+
+def _combine_output(stdout: bytes, stderr: bytes) -> str:
+    """Join stdout and stderr (if any) as bytes and decode the result once."""
+    out, err = stdout.strip(), stderr.strip()
+    return (b"\n".join((out, err)) if err else out).decode("utf-8", "replace")
+
+
+# Blocking Docker/Kubernetes client calls get their own pool, sized for
+# I/O-bound execs and independent of the loop's default executor
+_exec_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="env-exec")
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Like asyncio.to_thread, minus the contextvars copy these calls never need."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _exec_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+# DockerEnvironment clients keyed by compose project directory
+_docker_clients: dict[Path, Any] = {}
+
+# Cluster configuration shared by every K8sEnvironment
+_k8s_config = None
+
+
+def _get_k8s_config():
+    """The shared cluster Configuration, or None when none can be loaded."""
+    global _k8s_config
+    if _k8s_config is None:
+        from kubernetes import client, config
+
+        # Load kubeconfig once per process; without one, kubectl (which may
+        # be configured differently, e.g. via plugins) is used instead
+        k8s_config = client.Configuration()
+        try:
+            try:
+                config.load_kube_config(client_configuration=k8s_config)
+            except config.ConfigException:
+                config.load_incluster_config(client_configuration=k8s_config)
+        except config.ConfigException:
+            return None
+        _k8s_config = k8s_config
+    return _k8s_config
+
+
+# One CoreV1Api per exec pool thread, built from the shared configuration
+_k8s_thread_clients = threading.local()
+
+
+def _thread_k8s_api(k8s_config):
+    """This thread's CoreV1Api; clients never cross exec pool threads."""
+    api = getattr(_k8s_thread_clients, "api", None)
+    if api is None or api.api_client.configuration is not k8s_config:
+        from kubernetes import client
+
+        api = client.CoreV1Api(client.ApiClient(k8s_config))
+        _k8s_thread_clients.api = api
+    return api
 
 
 class RuntimeEnvironment(ABC):
     @abstractmethod
-    async def run_command(self, command: str, cwd: str = None) -> Tuple[bool, str, Any]:
-        """Execute a command in this environment."""
+    async def run_command(
+        self, command: str | list[str], cwd: str = None
+    ) -> tuple[bool, str, Any]:
+        """Execute a command (shell string or argv list) in this environment."""
         pass
 
 
 class LocalEnvironment(RuntimeEnvironment):
-    async def run_command(self, command: str, cwd: str = None) -> Tuple[bool, str, Any]:
+    async def run_command(
+        self,
+        command: str | list[str],
+        cwd: str = None,
+        capture: bool = True,
+        shell: bool = False,
+    ) -> tuple[bool, str, Any]:
+        """Run a command; with ``capture=False`` output is discarded."""
         try:
-            proc = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-            )
-            stdout, stderr = await proc.communicate()
-            return (
-                proc.returncode == 0,
-                stdout.decode().strip() + "\n" + stderr.decode().strip(),
-                None,
-            )
+            pipe = asyncio.subprocess.PIPE if capture else asyncio.subprocess.DEVNULL
+            proc = await spawn(command, shell=shell, stdout=pipe, stderr=pipe, cwd=cwd)
+            if not capture:
+                await proc.wait()
+                return proc.returncode == 0, "", None
+
+            stdout, stderr = await _collect_output(proc)
+            return proc.returncode == 0, _combine_output(stdout, stderr), None
+        except FileNotFoundError as e:
+            # Exec'd commands report a missing tool here, not via shell output
+            if e.filename and e.filename != cwd:
+                return False, f"Command '{e.filename}' not found in PATH.", None
+            return False, str(e), None
         except Exception as e:
             return False, str(e), None
 
 
+def _is_missing_container(exc: Exception) -> bool:
+    """True when Docker reports the container itself is gone (e.g. recreated)."""
+    if not _HAS_PYTHON_ON_WHALES:
+        return False
+    from python_on_whales.exceptions import NoSuchContainer
+
+    return isinstance(exc, NoSuchContainer)
+
+
 class DockerEnvironment(RuntimeEnvironment):
     def __init__(
         self,
         service_name: str,
         project_dir: str = ".",
         remote_root: str = "/app",
+        max_parallel: int = 8,
     ):
         self.service_name = service_name
         self.project_dir = Path(project_dir).resolve()
         self.remote_root = Path(remote_root)
         self._client = None
+        self._container_id = None
+        # Bounds concurrent execs so the Docker socket does not queue up
+        self._inflight = asyncio.Semaphore(max_parallel)
 
     def _get_client(self):
         if not self._client:
-            if not DockerClient:
+            try:
+                from python_on_whales import DockerClient
+            except ImportError:
                 raise ImportError(
                     "The 'python-on-whales' library is required for DockerEnvironment."
-                )
-            # Initialize with the project directory for compose context
-            self._client = DockerClient(compose_project_directory=self.project_dir)
+                ) from None
+            # One client per compose project directory, shared by all instances
+            self._client = _docker_clients.get(self.project_dir)
+            if self._client is None:
+                self._client = DockerClient(compose_project_directory=self.project_dir)
+                _docker_clients[self.project_dir] = self._client
         return self._client
 
-    async def run_command(self, command: str, cwd: str = None) -> Tuple[bool, str, Any]:
+    def _get_container_id(self, client) -> str:
+        # Resolve the service's container once; later execs skip compose
+        if not self._container_id:
+            containers = client.compose.ps(services=[self.service_name])
+            if not containers:
+                raise RuntimeError(
+                    f"No running container for service '{self.service_name}'."
+                )
+            self._container_id = containers[0].id
+        return self._container_id
+
+    async def run_command(
+        self, command: str | list[str], cwd: str = None
+    ) -> tuple[bool, str, Any]:
         """Execute a command inside a Docker container using the Python-on-Whales SDK."""
+        async with self._inflight:
+            return await self._run_command(command, cwd)
+
+    async def _run_command(self, command, cwd):
         try:
             client = self._get_client()
 
@@ -73,46 +277,113 @@ class DockerEnvironment(RuntimeEnvironment):
                     # If not relative to project_dir, we fallback to remote_root
                     pass
 
-            # Using SDK for execution via COMPOSE (which uses service names)
-            output = await asyncio.to_thread(
-                client.compose.execute,
-                service=self.service_name,
-                command=["sh", "-c", command],
+            # Exec straight into the cached container instead of going
+            # through compose service resolution on every command
+            container_id = await _run_blocking(self._get_container_id, client)
+            output = await _run_blocking(
+                client.container.execute,
+                container_id,
+                _remote_argv(command),
                 workdir=workdir,
             )
 
             return True, output, None
 
         except Exception as e:
+            # A failing command keeps the cached id; only a recreated or
+            # removed container needs resolving through compose again
+            if _is_missing_container(e):
+                self._container_id = None
             return False, f"Docker SDK Error: {e}", None
 
 
 class K8sEnvironment(RuntimeEnvironment):
-    def __init__(self, pod_name: str, namespace: str, container: str = "aether-lens"):
+    def __init__(
+        self,
+        pod_name: str,
+        namespace: str,
+        container: str = "aether-lens",
+        max_parallel: int = 16,
+    ):
         self.pod_name = pod_name
         self.namespace = namespace
         self.container = container
+        # Bounds concurrent execs against the API server / kubectl
+        self._inflight = asyncio.Semaphore(max_parallel)
+        # kubectl exec -n [namespace] [pod] -c [container] -- [argv...]
+        self._kubectl_prefix = (
+            "kubectl",
+            "exec",
+            "-n",
+            namespace,
+            pod_name,
+            "-c",
+            container,
+            "--",
+        )
 
-    async def run_command(self, command: str, cwd: str = None) -> Tuple[bool, str, Any]:
-        # kubectl exec -n [namespace] [pod] -c [container] -- [command]
-        full_command = f'kubectl exec -n {self.namespace} {self.pod_name} -c {self.container} -- sh -c "{command}"'
+    def _exec_via_api(self, k8s_config, argv: list[str]) -> tuple[bool, str]:
+        from kubernetes.stream import stream
+
+        # stream() swaps the request method of the client it is given while
+        # the exec runs; a per-thread client keeps concurrent execs apart
+        api = _thread_k8s_api(k8s_config)
+        resp = stream(
+            api.connect_get_namespaced_pod_exec,
+            self.pod_name,
+            self.namespace,
+            container=self.container,
+            command=argv,
+            stderr=True,
+            stdin=False,
+            stdout=True,
+            tty=False,
+            _preload_content=False,
+        )
         try:
-            proc = await asyncio.create_subprocess_shell(
-                full_command,
+            resp.run_forever()
+            output = _combine_output(
+                resp.read_stdout().encode(), resp.read_stderr().encode()
+            )
+            return resp.returncode == 0, output
+        finally:
+            resp.close()
+
+    async def run_command(
+        self, command: str | list[str], cwd: str = None
+    ) -> tuple[bool, str, Any]:
+        async with self._inflight:
+            return await self._run_command(command)
+
+    async def _run_command(self, command):
+        argv = _remote_argv(command)
+        k8s_config = await _run_blocking(_get_k8s_config) if _HAS_KUBERNETES else None
+        if k8s_config is not None:
+            from kubernetes.client.exceptions import ApiException
+            from websocket import WebSocketException
+
+            try:
+                success, output = await _run_blocking(
+                    self._exec_via_api, k8s_config, argv
+                )
+                return success, output, None
+            except (ApiException, WebSocketException, OSError) as e:
+                return False, f"Kubernetes API Error: {e}", None
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._kubectl_prefix,
+                *argv,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await proc.communicate()
-            success = proc.returncode == 0
-            output = stdout.decode().strip() + "\n" + stderr.decode().strip()
-
-            if (
-                not success
-                and "not found" in output.lower()
-                and "kubectl" in output.lower()
-            ):
-                output = "kubectl not found. Please ensure Kubernetes CLI is installed and in your PATH."
-
-            return success, output, None
+            stdout, stderr = await _collect_output(proc)
+            return proc.returncode == 0, _combine_output(stdout, stderr), None
+        except FileNotFoundError:
+            return (
+                False,
+                "kubectl not found. Please ensure Kubernetes CLI is installed and in your PATH.",
+                None,
+            )
         except Exception as e:
             return False, str(e), None
@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 from aether_lens.core.domain.models import (
@@ -15,16 +16,40 @@ class TestExecutor:
         self.event_emitter = event_emitter
         self.environment = environment or LocalEnvironment()
 
+    async def execute_tests(
+        self, tests, strategy, app_url, max_concurrency=8, on_done=None
+    ):
+        """Run tests concurrently (bounded), returning results in input order.
+
+        ``on_done(finished, total)`` is called as each test completes.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        finished = 0
+
+        async def _one(test):
+            nonlocal finished
+            async with sem:
+                result = await self.execute_test(test, strategy, app_url)
+            finished += 1
+            if on_done:
+                on_done(finished, len(tests))
+            return result
+
+        return list(await asyncio.gather(*(_one(t) for t in tests)))
+
     async def execute_test(self, test, strategy, app_url):
         test_type = test.get("type", "command")
         label = test.get("label")
         path_or_cmd = test.get("path") or test.get("command")
 
-        if self.event_emitter:
-            self.event_emitter.emit(
+        # Headless runs have no emitter: skip building events altogether
+        emit = self.event_emitter.emit if self.event_emitter else None
+        start_ts = time.time() if emit else None
+        if emit:
+            emit(
                 TestStartedEvent(
                     type="test_started",
-                    timestamp=time.time(),
+                    timestamp=start_ts,
                     label=label,
                     test_type=test_type,
                     strategy=strategy,
@@ -39,29 +64,30 @@ class TestExecutor:
             env = LocalEnvironment()
 
         if test_type == "command":
-            if self.event_emitter:
-                self.event_emitter.emit(
+            if emit:
+                emit(
                     PipelineLogEvent(
                         type="log",
-                        timestamp=time.time(),
+                        timestamp=start_ts,
                         message=f" -> [dim]Executing command:[/dim] {path_or_cmd}",
                     )
                 )
+            kwargs = {}
+            if isinstance(env, LocalEnvironment) and test.get("shell"):
+                kwargs["shell"] = True
             success, output, artifact = await env.run_command(
-                path_or_cmd, cwd=self.target_dir
+                path_or_cmd, cwd=self.target_dir, **kwargs
             )
 
         status = "PASSED" if success else "FAILED"
-        if self.event_emitter:
+        if emit:
+            end_ts = time.time()
             log_message = PipelineFormatter.format_log(label, status, output)
-            self.event_emitter.emit(
-                PipelineLogEvent(type="log", timestamp=time.time(), message=log_message)
-            )
-
-            self.event_emitter.emit(
+            emit(PipelineLogEvent(type="log", timestamp=end_ts, message=log_message))
+            emit(
                 TestFinishedEvent(
                     type="test_finished",
-                    timestamp=time.time(),
+                    timestamp=end_ts,
                     label=label,
                     status=status,
                     error=None if success else output,
@@ -1,6 +1,30 @@
-import threading
+import asyncio
+import os
+import signal
+from contextlib import suppress
 from typing import Any, Dict
 
+from rich.console import Console
+
+console = Console(stderr=True)
+
+# Seconds to wait for a handle to exit before escalating
+_STOP_TIMEOUT = 5.0
+_GROUP_POLL_INTERVAL = 0.05
+
+
+async def _wait_group_exit(pgid: int, timeout: float) -> bool:
+    """Wait until no process of group ``pgid`` is left; False on timeout."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        try:
+            os.killpg(pgid, 0)
+        except ProcessLookupError:
+            return True
+        if asyncio.get_running_loop().time() >= deadline:
+            return False
+        await asyncio.sleep(_GROUP_POLL_INTERVAL)
+
 
 class LifecycleRegistry:
     """
@@ -9,44 +33,72 @@ class LifecycleRegistry:
 
     def __init__(self):
         # target_dir -> list of handles
+        # setdefault/append/pop are atomic under the GIL, so no lock is needed
         self._active_resources: Dict[str, list] = {}
-        self._lock = threading.Lock()
 
     def register(self, target_dir: str, handle: Any):
         """Register a background resource handle."""
-        with self._lock:
-            if target_dir not in self._active_resources:
-                self._active_resources[target_dir] = []
-            self._active_resources[target_dir].append(handle)
+        self._active_resources.setdefault(target_dir, []).append(handle)
 
-    def stop(self, target_dir: str) -> bool:
+    async def stop(self, target_dir: str) -> bool:
         """Stop and remove all background resource handles for a directory."""
-        with self._lock:
-            if target_dir in self._active_resources:
-                handles = self._active_resources.pop(target_dir)
-                for handle in handles:
-                    try:
-                        if hasattr(handle, "stop") and hasattr(handle, "join"):
-                            # watchdog Observer
-                            handle.stop()
-                            handle.join()
-                        elif hasattr(handle, "terminate"):
-                            # Process handle (asyncio or subprocess)
-                            handle.terminate()
-                            # For sync processes, we might want to wait,
-                            # but we can't await here easily without making stop async.
-                    except Exception:
-                        pass
-                return True
+        handles = self._active_resources.pop(target_dir, None)
+        if handles is None:
             return False
+        await asyncio.gather(*(self._stop_handle(h) for h in handles))
+        return True
+
+    @staticmethod
+    async def _stop_handle(handle: Any):
+        try:
+            if hasattr(handle, "stop") and hasattr(handle, "join"):
+                # watchdog Observer
+                handle.stop()
+                await asyncio.to_thread(handle.join, _STOP_TIMEOUT)
+            elif isinstance(handle, asyncio.subprocess.Process):
+                pgid = getattr(handle, "pgid", None)
+                if pgid:
+                    await LifecycleRegistry._stop_group(handle, pgid)
+                elif handle.returncode is None:
+                    handle.terminate()
+                    try:
+                        await asyncio.wait_for(handle.wait(), _STOP_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        handle.kill()
+                        await handle.wait()
+            elif hasattr(handle, "terminate"):
+                # Blocking handles (e.g. SDK compose projects, subprocess.Popen)
+                await asyncio.to_thread(handle.terminate)
+        except Exception as e:
+            # e.g. the SIGKILL escalation failed; the process may still be alive
+            console.print(
+                f"[bold red][Lifecycle] Failed to stop {type(handle).__name__}:"
+                f"[/bold red] {e!r}"
+            )
+
+    @staticmethod
+    async def _stop_group(handle: asyncio.subprocess.Process, pgid: int):
+        # Session leader started by start_background_process; also takes down
+        # children spawned through a shell
+        try:
+            os.killpg(pgid, signal.SIGTERM)
+        except ProcessLookupError:
+            return  # The whole group has already exited
+        deadline = asyncio.get_running_loop().time() + _STOP_TIMEOUT
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(handle.wait(), _STOP_TIMEOUT)
+        # The leader may exit while children that ignore SIGTERM live on,
+        # so the escalation targets whatever is left of the group
+        remaining = max(deadline - asyncio.get_running_loop().time(), 0)
+        if not await _wait_group_exit(pgid, remaining):
+            with suppress(ProcessLookupError):
+                os.killpg(pgid, signal.SIGKILL)
+        await handle.wait()
 
     def list_active(self) -> list:
         """List all active target directories."""
-        with self._lock:
-            return list(self._active_resources.keys())
+        return list(self._active_resources)
 
-    def stop_all(self):
+    async def stop_all(self):
         """Stop all registered background processes."""
-        targets = self.list_active()
-        for t in targets:
-            self.stop(t)
+        await asyncio.gather(*(self.stop(t) for t in self.list_active()))
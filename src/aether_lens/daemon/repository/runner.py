@@ -1,99 +1,146 @@
 import argparse
 import asyncio
 import json
+import os
+import shutil
+from html.parser import HTMLParser
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Static assets and dev-server internals are never audited
+_ASSET_SUFFIXES = (".js", ".css", ".png", ".jpg", ".svg", ".ico", ".json", ".xml")
+
+
+class _LinkExtractor(HTMLParser):
+    """Collects the href of every <a> tag in a document."""
+
+    def __init__(self):
+        super().__init__()
+        self.hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            for name, value in attrs:
+                if name == "href" and value:
+                    self.hrefs.append(value)
 
 
 class SiteAuditor:
     def __init__(self, base_url: str = None, current_dir: str = None):
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.current_dir = Path(current_dir or Path.cwd())
+        self._lighthouse = None
+
+    def _lighthouse_cmd(self):
+        """Resolve the lighthouse launcher once; npx only as a fallback."""
+        if self._lighthouse is None:
+            installed = shutil.which("lighthouse")
+            self._lighthouse = [installed] if installed else ["npx", "-y", "lighthouse"]
+        return self._lighthouse
 
-    async def run_external_tool(self, cmd, label):
+    async def run_external_tool(self, cmd, label, raw=False):
+        """Run a tool; ``raw=True`` returns stdout as bytes and discards stderr."""
         print(f" -> Running {label}: {' '.join(cmd)}")
         proc = await asyncio.create_subprocess_exec(
-            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL if raw else asyncio.subprocess.PIPE,
         )
         stdout, stderr = await proc.communicate()
+        if raw:
+            return proc.returncode, stdout, b""
         return proc.returncode, stdout.decode(), stderr.decode()
 
+    async def _fetch_links(self, client, url):
+        """GET a page; return (is 200, hrefs found if it is HTML)."""
+        try:
+            resp = await client.get(url)
+        except httpx.HTTPError:
+            return False, []
+        if resp.status_code != 200:
+            return False, []
+        if "html" not in resp.headers.get("content-type", ""):
+            return True, []
+        extractor = _LinkExtractor()
+        extractor.feed(resp.text)
+        return True, extractor.hrefs
+
+    async def discover_urls(self, max_crawl=100, concurrency=8):
+        """Crawl same-host pages breadth-first and return those that answer 200."""
+        base = urlparse(self.base_url)
+        base_netloc = base.netloc
+        start = f"{base.scheme}://{base_netloc}{base.path or '/'}"
+        seen = {start}
+        frontier = [start]
+        found = set()
+
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(
+            follow_redirects=True, timeout=10.0, limits=limits
+        ) as client:
+            while frontier:
+                results = await asyncio.gather(
+                    *(self._fetch_links(client, url) for url in frontier)
+                )
+                next_frontier = []
+                for url, (ok, hrefs) in zip(frontier, results):
+                    if ok:
+                        found.add(url)
+                    for href in hrefs:
+                        parsed = urlparse(urljoin(url, href))
+                        if parsed.scheme not in ("http", "https"):
+                            continue
+                        if parsed.netloc != base_netloc:
+                            continue
+                        path = parsed.path.lower()
+                        if path.endswith(_ASSET_SUFFIXES):
+                            continue
+                        if path.startswith("/@") or "/node_modules/" in path:
+                            continue
+
+                        clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+                        if clean_url not in seen and len(seen) < max_crawl:
+                            seen.add(clean_url)
+                            next_frontier.append(clean_url)
+                frontier = next_frontier
+        return found
+
     async def audit_site(self, parameters):
-        """Use linkinator to discover URLs and lighthouse to audit them."""
+        """Crawl the site for pages and audit them with lighthouse."""
         print(f"Starting Site Health Audit via External Tools on {self.base_url}...")
 
-        # 1. Discover URLs via linkinator
-        linkinator_cmd = [
-            "npx",
-            "-y",
-            "linkinator",
-            self.base_url,
-            "--recurse",
-            "--format",
-            "json",
-            "--dry-run",
-        ]
-
-        rc, out, err = await self.run_external_tool(
-            linkinator_cmd, "Linkinator (Crawler)"
+        # 1. Discover URLs with an in-process crawler (no npx/linkinator start-up)
+        urls_to_test = await self.discover_urls(
+            max_crawl=int(parameters.get("max_crawl", 100))
         )
-        if rc != 0:
-            print(f"Linkinator failed: {err}")
+        if not urls_to_test:
+            print(f"Crawler could not reach {self.base_url}")
             return False
 
-        try:
-            data = json.loads(out)
-            links = data.get("links", [])
-        except Exception as e:
-            print(f"Failed to parse Linkinator output: {e}")
-            return False
-
-        # Filter internal successful HTML-like URLs
-        base_parsed = urlparse(self.base_url)
-        urls_to_test = set()
-        for link in links:
-            u = link.get("url")
-            if not u or link.get("status") != 200:
-                continue
-            parsed = urlparse(u)
-            if parsed.netloc != base_parsed.netloc:
-                continue
-
-            path = parsed.path.lower()
-            if any(
-                path.endswith(ext)
-                for ext in [
-                    ".js",
-                    ".css",
-                    ".png",
-                    ".jpg",
-                    ".svg",
-                    ".ico",
-                    ".json",
-                    ".xml",
-                ]
-            ):
-                continue
-            if path.startswith("/@") or "/node_modules/" in path:
-                continue
-
-            clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-            urls_to_test.add(clean_url)
-
         print(f"Discovered {len(urls_to_test)} pages to audit.")
 
         # 2. Audit each URL via Lighthouse
-        success = True
         # To avoid extreme slowness, we limit the number of pages in audit
         max_audit = int(parameters.get("max_pages", 5))
         pages = sorted(list(urls_to_test))[:max_audit]
+        threshold = float(parameters.get("min_score", 80))
+
+        # Audits are independent; cap concurrent Chromium instances
+        concurrency = int(parameters.get("concurrency", min(os.cpu_count() or 1, 4)))
+        sem = asyncio.Semaphore(max(concurrency, 1))
 
-        for url in pages:
-            print(f"\n--- Auditing: {url} ---")
+        async def _audit_one(url):
+            # Report lines are printed together so parallel audits don't interleave
+            lines = [f"\n--- Auditing: {url} ---"]
             lh_cmd = [
-                "npx",
-                "-y",
-                "lighthouse",
+                *self._lighthouse_cmd(),
                 url,
                 "--output",
                 "json",
@@ -102,26 +149,44 @@ class SiteAuditor:
                 "--quiet",
             ]
 
-            rc, out, err = await self.run_external_tool(lh_cmd, "Lighthouse")
+            async with sem:
+                # Multi-MB report: parse the bytes directly, no str copy
+                rc, out, _ = await self.run_external_tool(
+                    lh_cmd, "Lighthouse", raw=True
+                )
+
+            ok = True
             if rc != 0:
-                print(f"FAILED: Lighthouse audit for {url}")
-                success = False
-                continue
-
-            try:
-                report = json.loads(out)
-                scores = {k: v["score"] * 100 for k, v in report["categories"].items()}
-                print(f"PASSED: {url} | Scores: {scores}")
-
-                threshold = float(parameters.get("min_score", 80))
-                for cat, score in scores.items():
-                    if score < threshold:
-                        print(
-                            f"  [WARNING] {cat} score is below threshold: {score} < {threshold}"
-                        )
-            except Exception as e:
-                print(f"Error parsing Lighthouse report for {url}: {e}")
-                success = False
+                lines.append(f"FAILED: Lighthouse audit for {url}")
+                ok = False
+            else:
+                try:
+                    report = orjson.loads(out) if orjson else json.loads(out)
+                    scores = {
+                        k: v["score"] * 100 for k, v in report["categories"].items()
+                    }
+                    lines.append(f"PASSED: {url} | Scores: {scores}")
+
+                    for cat, score in scores.items():
+                        if score < threshold:
+                            lines.append(
+                                f"  [WARNING] {cat} score is below threshold: {score} < {threshold}"
+                            )
+                except Exception as e:
+                    lines.append(f"Error parsing Lighthouse report for {url}: {e}")
+                    ok = False
+
+            print("\n".join(lines))
+            return ok
+
+        results = await asyncio.gather(
+            *(_audit_one(url) for url in pages), return_exceptions=True
+        )
+        for url, result in zip(pages, results):
+            if isinstance(result, BaseException):
+                # A crashed audit must not look like a missing result
+                print(f"ERROR: Lighthouse audit for {url} crashed: {result!r}")
+        success = all(r is True for r in results)
 
         return success
 
@@ -147,19 +212,12 @@ if __name__ == "__main__":
     args, unknown = parser.parse_known_args()
 
     params = {"threshold": args.threshold}
-    i = 0
-    while i < len(unknown):
-        key = unknown[i]
-        if key.startswith("--"):
-            k = key[2:]
-            if i + 1 < len(unknown) and not unknown[i + 1].startswith("--"):
-                params[k] = unknown[i + 1]
-                i += 2
-            else:
-                params[k] = True
-                i += 1
-        else:
-            i += 1
+    # Pair each --key with the token after it; a bare --flag becomes True
+    for key, nxt in zip(unknown, unknown[1:] + ["--"]):
+        if not key.startswith("--"):
+            continue
+        k, eq, v = key[2:].partition("=")
+        params[k] = v if eq else (True if nxt.startswith("--") else nxt)
 
     auditor = SiteAuditor(base_url=args.base_url)
     asyncio.run(auditor.execute_suite(args.suite_id, params))
@@ -1,11 +1,21 @@
 import asyncio
 import base64
+import io
+import tarfile
 from pathlib import Path
 
 from rich.console import Console
 
+from aether_lens.daemon.repository.discovery import ToolResolver
+
 console = Console(stderr=True)
 
+# $1 remote path, $2 base64 diff, $3 browser strategy, $4 browser URL (optional)
+_TRIGGER_SCRIPT = (
+    'AETHER_DIFF_B64="$2" TARGET_DIR="$1" aether-lens run'
+    ' --browser-strategy "$3" ${4:+--browser-url "$4"} "$1"'
+)
+
 
 class LocalLensLoopHandler:
     """
@@ -28,42 +38,28 @@ class LocalLensLoopHandler:
         self.browser_strategy = browser_strategy
         self.browser_url = browser_url
 
-    async def sync_and_trigger(self, changed_file_path=None):
+    async def sync_and_trigger(self, changed_paths=None):
+        """Sync a batch of changed files to the pod, then trigger one remote run."""
         try:
-            # 1. Get Diff (Git)
+            # 1. Get Diff (Git). The remote agent gets the whole working tree
+            # diff, so changes from earlier batches it has not seen still count.
             diff = await self.get_git_diff()
-            diff_b64 = base64.b64encode(diff.encode("utf-8")).decode("utf-8")
-
-            # 2. Sync File (kubectl cp)
-            if changed_file_path:
-                rel_path = Path(changed_file_path).relative_to(self.target_dir)
-                dest_path = (Path(self.remote_path) / rel_path).as_posix()
-
-                proc = await asyncio.create_subprocess_exec(
-                    "kubectl",
-                    "cp",
-                    "-n",
-                    self.namespace,
-                    str(changed_file_path),
-                    f"{self.namespace}/{self.pod_name}:{dest_path}",
-                    "-c",
-                    "aether-lens",
-                )
-                await proc.wait()
+            # Raw bytes straight to base64: no utf-8 decode/encode round-trip
+            diff_b64 = base64.b64encode(diff).decode("ascii")
 
-            # 3. Trigger Remote Agent (kubectl exec)
-            env_vars = f"AETHER_DIFF_B64={diff_b64} TARGET_DIR={self.remote_path}"
-            browser_opts = f"--browser-strategy {self.browser_strategy}"
-            if self.browser_url:
-                browser_opts += f" --browser-url {self.browser_url}"
+            # 2. Pack the batch into one tar stream instead of a kubectl cp per file
+            archive = await asyncio.to_thread(self._pack_files, changed_paths or ())
 
-            trigger_cmd = (
-                f"{env_vars} aether-lens run {browser_opts} {self.remote_path}"
-            )
+            # 3. Extract and trigger the Remote Agent in a single kubectl exec.
+            # Values travel as positional args, never interpolated into the script.
+            trigger_cmd = _TRIGGER_SCRIPT
+            if archive:
+                trigger_cmd = f'tar xf - -C "$1"; {trigger_cmd}'
 
             proc = await asyncio.create_subprocess_exec(
                 "kubectl",
                 "exec",
+                "-i",
                 "-n",
                 self.namespace,
                 self.pod_name,
@@ -73,38 +69,65 @@ class LocalLensLoopHandler:
                 "bin/sh",
                 "-c",
                 trigger_cmd,
+                "sh",
+                self.remote_path,
+                diff_b64,
+                self.browser_strategy,
+                self.browser_url or "",
+                stdin=asyncio.subprocess.PIPE,
             )
-            await proc.wait()
+            await proc.communicate(archive)
 
         except Exception as e:
             console.print(f"[bold red]Sync Error:[/bold red] {e}")
 
+    def _pack_files(self, paths):
+        """Tar the given files (relative to target_dir) into memory; None if empty."""
+        buf = io.BytesIO()
+        packed = 0
+        with tarfile.open(fileobj=buf, mode="w") as tar:
+            for changed_file_path in paths:
+                path = Path(changed_file_path)
+                if not path.is_file():
+                    # Deleted/moved-away files have nothing to copy
+                    continue
+                try:
+                    rel_path = path.relative_to(self.target_dir)
+                except ValueError:
+                    continue
+                tar.add(path, arcname=rel_path.as_posix(), recursive=False)
+                packed += 1
+        return buf.getvalue() if packed else None
+
     async def get_git_diff(self):
+        """Raw diff bytes of the working tree against HEAD; one git call per batch."""
+        git_dirs = await ToolResolver.git_dir_args(self.target_dir)
         try:
             proc = await asyncio.create_subprocess_exec(
                 "git",
                 "-C",
                 str(self.target_dir),
+                *git_dirs,
                 "diff",
                 "HEAD",
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             stdout, _ = await proc.communicate()
-            diff = stdout.decode().strip()
 
-            if not diff:
+            if proc.returncode != 0:
+                # No HEAD yet (fresh repo): fall back to the index diff
                 proc = await asyncio.create_subprocess_exec(
                     "git",
                     "-C",
                     str(self.target_dir),
+                    *git_dirs,
                     "diff",
                     stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
                 )
                 stdout, _ = await proc.communicate()
-                diff = stdout.decode().strip()
 
-            return diff
+            return stdout.strip()
         except Exception:
-            return ""
+            return b""
@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("dependency_injector")
+pytest.importorskip("click")
+
+from click.testing import CliRunner
+from dependency_injector import providers
+
+from aether_lens.client.cli.commands import loop as loop_module
+from aether_lens.core.containers import Container
+
+
+class _StubObserver:
+    def __init__(self):
+        self.joined = False
+        self.stopped = False
+
+    def join(self):
+        self.joined = True
+
+    def stop(self):
+        self.stopped = True
+
+
+class _StubOrchestrator:
+    def __init__(self, observer):
+        self.observer = observer
+        self.calls = []
+
+    async def start_loop(self, **kwargs):
+        self.calls.append(kwargs)
+        return self.observer
+
+
+def test_loop_command_starts_the_orchestrator_loop_and_blocks_on_the_observer():
+    observer = _StubObserver()
+    orchestrator = _StubOrchestrator(observer)
+    container = Container()
+    container.orchestrator.override(providers.Object(orchestrator))
+    container.execution_service.override(providers.Object(object()))
+    container.wire(modules=[loop_module])
+    try:
+        result = CliRunner().invoke(
+            loop_module.loop, ["proj", "web-0", "--namespace", "dev"]
+        )
+    finally:
+        container.unwire()
+
+    assert result.exit_code == 0, result.output
+    assert orchestrator.calls == [
+        {
+            "target_dir": "proj",
+            "pod_name": "web-0",
+            "namespace": "dev",
+            "remote_path": "/app/project",
+            "browser_strategy": "inpod",
+            "browser_url": None,
+        }
+    ]
+    assert observer.joined
+    assert observer.stopped
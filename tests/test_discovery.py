@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from aether_lens.daemon.repository.discovery import ToolResolver
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    ToolResolver.clear_cache()
+    yield
+    ToolResolver.clear_cache()
+
+
+def _make_tool(directory, name):
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX executables")
+def test_tool_installed_after_a_miss_is_found(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert ToolResolver.find_executable("lens-late-tool") is None
+
+    installed = _make_tool(tmp_path, "lens-late-tool")
+
+    assert ToolResolver.find_executable("lens-late-tool") == installed
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX executables")
+def test_path_change_resolves_cached_names_again(tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _make_tool(first, "lens-tool")
+    in_second = _make_tool(second, "lens-tool")
+
+    monkeypatch.setenv("PATH", str(first))
+    assert ToolResolver.find_executable("lens-tool") == str(first / "lens-tool")
+
+    monkeypatch.setenv("PATH", str(second))
+    assert ToolResolver.find_executable("lens-tool") == in_second
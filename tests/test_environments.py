@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+from aether_lens.daemon.repository import environments
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.skipif(environments.os.name == "nt", reason="POSIX shell builtins")
+@pytest.mark.parametrize("command", ["cd /", "export AETHER_LENS_TEST=1", ": noop"])
+def test_spawn_runs_shell_builtins_through_a_shell(command):
+    async def run():
+        proc = await environments.spawn(command)
+        return await proc.wait()
+
+    assert _run(run()) == 0
+
+
+def test_spawn_uses_the_shell_on_windows(monkeypatch):
+    calls = []
+
+    async def fake_shell(command, **kwargs):
+        calls.append(("shell", command))
+
+    async def fake_exec(*argv, **kwargs):
+        calls.append(("exec", argv))
+
+    monkeypatch.setattr(environments.os, "name", "nt")
+    monkeypatch.setattr(environments.asyncio, "create_subprocess_shell", fake_shell)
+    monkeypatch.setattr(environments.asyncio, "create_subprocess_exec", fake_exec)
+
+    _run(environments.spawn("npm run dev"))
+
+    assert calls == [("shell", "npm run dev")]
+
+
+def test_spawn_execs_plain_commands_directly(monkeypatch):
+    calls = []
+
+    async def fake_exec(*argv, **kwargs):
+        calls.append(argv)
+
+    monkeypatch.setattr(environments.os, "name", "posix")
+    monkeypatch.setattr(environments.asyncio, "create_subprocess_exec", fake_exec)
+
+    _run(environments.spawn("npm run dev"))
+
+    assert calls == [("npm", "run", "dev")]
+
+
+@pytest.mark.skipif(environments.os.name == "nt", reason="POSIX shell builtins")
+def test_local_environment_runs_builtin_test_commands():
+    ok, output, _ = _run(environments.LocalEnvironment().run_command("cd /"))
+
+    assert ok, output
+
+
+@pytest.mark.skipif(environments.os.name == "nt", reason="cmd.exe wording differs")
+def test_local_environment_reports_missing_tools():
+    ok, output, _ = _run(
+        environments.LocalEnvironment().run_command(
+            "aether-lens-missing-tool --version"
+        )
+    )
+
+    assert not ok
+    assert "not found" in output
+
+
+class _FakeContainers:
+    def __init__(self, error):
+        self.error = error
+
+    def execute(self, *args, **kwargs):
+        raise self.error
+
+
+class _FakeDockerClient:
+    def __init__(self, error):
+        self.container = _FakeContainers(error)
+
+
+@pytest.mark.parametrize("missing", [False, True])
+def test_docker_container_id_survives_failing_commands(missing):
+    exceptions = pytest.importorskip("python_on_whales.exceptions")
+    error_cls = exceptions.NoSuchContainer if missing else exceptions.DockerException
+
+    env = environments.DockerEnvironment("web")
+    env._client = _FakeDockerClient(error_cls(["docker", "exec"], 1))
+    env._container_id = "abc123"
+
+    ok, _, _ = _run(env.run_command("npm test"))
+
+    assert not ok
+    assert env._container_id == (None if missing else "abc123")
+
+
+@pytest.mark.skipif(environments.os.name == "nt", reason="POSIX fake kubectl")
+def test_k8s_falls_back_to_kubectl_without_cluster_config(tmp_path, monkeypatch):
+    pytest.importorskip("kubernetes")
+    kubectl = tmp_path / "kubectl"
+    kubectl.write_text('#!/bin/sh\necho "kubectl $*"\n')
+    kubectl.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{environments.os.pathsep}/usr/bin:/bin")
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "missing-kubeconfig"))
+    monkeypatch.delenv("KUBERNETES_SERVICE_HOST", raising=False)
+    monkeypatch.setattr(environments, "_k8s_config", None)
+
+    env = environments.K8sEnvironment("web-0", "default")
+    ok, output, _ = _run(env.run_command(["npm", "test"]))
+
+    assert ok, output
+    assert output == "kubectl exec -n default web-0 -c aether-lens -- npm test"
+
+
+class _FakeExecResponse:
+    returncode = 0
+
+    def run_forever(self):
+        pass
+
+    def read_stdout(self):
+        return "ok"
+
+    def read_stderr(self):
+        return ""
+
+    def close(self):
+        pass
+
+
+def test_k8s_api_execs_never_share_a_client_across_threads(monkeypatch):
+    k8s_client = pytest.importorskip("kubernetes.client")
+    clients = []
+
+    def fake_stream(api_method, *args, **kwargs):
+        clients.append(api_method.__self__.api_client)
+        return _FakeExecResponse()
+
+    monkeypatch.setattr("kubernetes.stream.stream", fake_stream)
+    k8s_config = k8s_client.Configuration()
+    env = environments.K8sEnvironment("web-0", "default")
+
+    def exec_twice():
+        assert env._exec_via_api(k8s_config, ["true"]) == (True, "ok")
+        assert env._exec_via_api(k8s_config, ["true"]) == (True, "ok")
+
+    threads = [environments.threading.Thread(target=exec_twice) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(clients) == 4
+    # Reused within a thread, never shared between threads
+    assert len({id(c) for c in clients}) == 2
+    assert all(c.configuration is k8s_config for c in clients)
@@ -0,0 +1,185 @@
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+execution = pytest.importorskip("aether_lens.daemon.controller.execution")
+
+
+def test_aclose_shuts_down_the_docker_pool():
+    controller = execution.ExecutionController(config={})
+
+    async def run():
+        assert await controller._run_docker_call(lambda: 42) == 42
+        pool = controller._docker_executor
+        await controller.aclose()
+        return pool
+
+    pool = asyncio.run(run())
+
+    assert controller._docker_executor is None
+    assert pool._shutdown
+
+
+def test_docker_pool_is_recreated_after_close():
+    controller = execution.ExecutionController(config={})
+    controller.close()
+
+    assert asyncio.run(controller._run_docker_call(lambda: "ok")) == "ok"
+    controller.close()
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_huge_change_batches_fall_back_to_an_unscoped_diff(tmp_path):
+    _git(tmp_path, "init", "-q")
+    tracked = tmp_path / "app.txt"
+    tracked.write_text("one\n")
+    _git(tmp_path, "add", ".")
+    _git(
+        tmp_path,
+        "-c",
+        "user.name=lens",
+        "-c",
+        "user.email=lens@example.com",
+        "commit",
+        "-qm",
+        "init",
+    )
+    tracked.write_text("two\n")
+
+    # A branch checkout-sized batch: far beyond ARG_MAX as one pathspec
+    paths = [str(tracked)] + [
+        str(tmp_path / f"{'d' * 100}{i}.txt") for i in range(30000)
+    ]
+    controller = execution.ExecutionController(config={})
+
+    async def run():
+        changed = await controller._has_git_changes(str(tmp_path), paths)
+        return changed, await controller.get_git_diff(str(tmp_path), paths)
+
+    changed, diff = asyncio.run(run())
+
+    assert changed
+    assert "+two" in diff
+
+
+def _quiet_controller(monkeypatch):
+    controller = execution.ExecutionController(config={})
+    lines = []
+    monkeypatch.setattr(
+        controller, "_emit_log", lambda _, message: lines.append(message)
+    )
+    return controller
+
+
+def _hook(controller, script):
+    command = [sys.executable, "-c", script]
+    return asyncio.run(controller.run_deployment_hook(command))
+
+
+def test_deployment_hook_survives_huge_unterminated_lines(monkeypatch):
+    controller = _quiet_controller(monkeypatch)
+    script = (
+        "import sys; sys.stdout.write('x' * (3 * 1024 * 1024)); "
+        "sys.stdout.write('\\ndone\\n')"
+    )
+
+    ok, output = _hook(controller, script)
+
+    assert ok
+    assert output.endswith("done")
+
+
+def test_deployment_hook_splits_carriage_return_progress(monkeypatch):
+    controller = _quiet_controller(monkeypatch)
+    script = "import sys; sys.stdout.write('10%\\r50%\\r100%\\r\\nok\\r\\n')"
+
+    ok, output = _hook(controller, script)
+
+    assert ok
+    assert output.split("\n") == ["10%", "50%", "100%", "ok"]
+
+
+def test_deployment_hook_reaps_the_process_when_cancelled(monkeypatch):
+    controller = _quiet_controller(monkeypatch)
+    spawned = []
+    real_spawn = execution.spawn
+
+    async def recording_spawn(*args, **kwargs):
+        proc = await real_spawn(*args, **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(execution, "spawn", recording_spawn)
+
+    async def run():
+        task = asyncio.create_task(
+            controller.run_deployment_hook(
+                [sys.executable, "-c", "import time; time.sleep(60)"]
+            )
+        )
+        while not spawned:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert spawned[0].returncode is not None
+
+
+def test_load_config_rereads_same_mtime_rewrites(tmp_path):
+    controller = execution.ExecutionController(config={})
+    config_path = tmp_path / "aether-lens.config.json"
+    config_path.write_text('{"strategy": "auto"}')
+    mtime_ns = config_path.stat().st_mtime_ns
+
+    assert controller.load_config(str(tmp_path))["strategy"] == "auto"
+
+    # Same timestamp, as on a filesystem with coarse mtimes
+    config_path.write_text('{"strategy": "full-suite"}')
+    os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+    assert controller.load_config(str(tmp_path))["strategy"] == "full-suite"
+
+
+def test_shared_clients_outlive_overlapping_pipelines(tmp_path, monkeypatch):
+    controller = _quiet_controller(monkeypatch)
+    monkeypatch.setattr(controller, "_create_execution_environment", lambda *a: None)
+    released = asyncio.Event()
+    entered = []
+
+    async def prepare_services(target_dir, config, event_emitter):
+        entered.append(target_dir)
+        if len(entered) == 1:
+            await released.wait()
+        return False
+
+    monkeypatch.setattr(controller, "_prepare_services", prepare_services)
+
+    async def run():
+        client = controller._get_health_check_client()
+        first = asyncio.create_task(
+            controller.run_pipeline(str(tmp_path), instrument=False)
+        )
+        while not entered:
+            await asyncio.sleep(0)
+        # A second pipeline finishing must not close what the first still uses
+        await controller.run_pipeline(str(tmp_path), instrument=False)
+        assert controller._hc_client is client
+        released.set()
+        await first
+        return client
+
+    client = asyncio.run(run())
+
+    assert client.is_closed
+    assert controller._hc_client is None
@@ -0,0 +1,50 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from aether_lens.daemon.repository import lifecycle
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="process groups via /proc"
+)
+
+
+def _is_gone(pid):
+    # Reparented children may linger as zombies when nothing reaps them
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] == "Z"
+    except FileNotFoundError:
+        return True
+
+
+def test_stop_kills_grandchildren_that_ignore_sigterm(monkeypatch):
+    monkeypatch.setattr(lifecycle, "_STOP_TIMEOUT", 0.5)
+    # The leader exits on SIGTERM; its background child ignores it
+    script = "sh -c 'trap \"\" TERM; echo $$; exec sleep 60 >/dev/null' & wait"
+
+    async def run():
+        proc = await asyncio.create_subprocess_exec(
+            "sh",
+            "-c",
+            script,
+            stdout=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        proc.pgid = proc.pid
+        grandchild = int(await proc.stdout.readline())
+        registry = lifecycle.LifecycleRegistry()
+        registry.register("/project", proc)
+        assert await registry.stop("/project")
+        return proc, grandchild
+
+    proc, grandchild = asyncio.run(run())
+
+    assert proc.returncode is not None
+    # SIGKILL delivery is asynchronous; allow the kernel a moment
+    deadline = time.monotonic() + 2
+    while not _is_gone(grandchild) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _is_gone(grandchild)
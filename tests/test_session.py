@@ -0,0 +1,66 @@
+import asyncio
+import base64
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from aether_lens.daemon.repository import discovery, session
+
+pytestmark = pytest.mark.skipif(
+    os.name == "nt" or shutil.which("git") is None,
+    reason="needs git and a POSIX fake kubectl",
+)
+
+
+def _git(cwd, *args):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_discovery_caches():
+    discovery.ToolResolver.clear_cache()
+    yield
+    discovery.ToolResolver.clear_cache()
+
+
+def test_remote_agent_receives_changes_from_earlier_batches(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name in ("a.txt", "b.txt"):
+        (repo / name).write_text(f"{name} v1\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(
+        repo,
+        "-c",
+        "user.name=lens",
+        "-c",
+        "user.email=lens@example.com",
+        "commit",
+        "-qm",
+        "init",
+    )
+
+    # Records the base64 diff passed to the remote trigger script
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    recorded = tmp_path / "diff.b64"
+    kubectl = bin_dir / "kubectl"
+    kubectl.write_text(
+        f'#!/bin/sh\ncat >/dev/null\nprintf "%s" "${{14}}" > "{recorded}"\n'
+    )
+    kubectl.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    handler = session.LocalLensLoopHandler(repo, "web-0", "dev", "/app/project")
+
+    # An earlier batch changed a.txt; the sync for it may never have landed
+    (repo / "a.txt").write_text("a.txt v2\n")
+    (repo / "b.txt").write_text("b.txt v2\n")
+    asyncio.run(handler.sync_and_trigger({str(repo / "b.txt")}))
+
+    diff = base64.b64decode(recorded.read_text())
+    assert b"+a.txt v2" in diff
+    assert b"+b.txt v2" in diff
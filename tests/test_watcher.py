@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+watcher = pytest.importorskip("aether_lens.daemon.controller.watcher")
+
+
+def test_consumer_survives_a_failing_callback(tmp_path):
+    batches = []
+
+    async def callback(batch):
+        batches.append(batch)
+        if len(batches) == 1:
+            raise RuntimeError("boom")
+
+    async def run():
+        ctrl = watcher.WatchController(
+            str(tmp_path),
+            callback,
+            debounce_seconds=0.01,
+            loop=asyncio.get_running_loop(),
+        )
+        ctrl._start_consumer()
+        for i, name in enumerate(("a.txt", "b.txt")):
+            with ctrl._pending_lock:
+                ctrl._pending.add(str(tmp_path / name))
+                ctrl._generation += 1
+            ctrl._wake.set()
+            while len(batches) <= i:
+                await asyncio.sleep(0.01)
+        ctrl._consumer_task.cancel()
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    assert batches == [{str(tmp_path / "a.txt")}, {str(tmp_path / "b.txt")}]